@@ -21,7 +21,35 @@ YUKKURI_SPEAK_STOP_URL = f"http://{YUKKURI_HOSTNAME}:{YUKKURI_PORT}/voice_output
 
 # Messenger process
 MESSENGER_PORT = 50050
+# Cap on concurrent /messages/stream connections; each open stream holds a
+# server worker thread, so further streams are refused with 503
+MESSENGER_MAX_STREAMS = 4
+# Worker threads: one per allowed stream plus headroom for the listener's
+# long-poll and regular requests, so streams can never starve replies
+MESSENGER_SERVER_THREADS = MESSENGER_MAX_STREAMS + 6
+# Upper bound for GET /messages?wait=<seconds> long-poll requests
+MESSENGER_LONG_POLL_MAX_WAIT = 30.0
+# Long-poll duration used by MessageManager's new-message listener
+MESSENGER_LISTEN_WAIT = 10.0
+# Streamed replies are sent to the chat window after this many chunks or
+# this many seconds, whichever comes first
+MESSENGER_STREAM_FLUSH_CHUNKS = 8
+MESSENGER_STREAM_FLUSH_INTERVAL = 0.05
+# Seconds between keep-alive comments on idle /messages/stream connections
+MESSENGER_STREAM_KEEPALIVE = 15.0
+# Seconds between checks for a disconnected /messages/stream client
+MESSENGER_STREAM_POLL_INTERVAL = 1.0
+# Streams are ended after this many seconds and EventSource reconnects, so
+# no connection holds a worker thread indefinitely
+MESSENGER_STREAM_MAX_DURATION = 300.0
+# Reconnect delay (milliseconds) sent to stream clients in the "retry:" field
+MESSENGER_STREAM_RETRY_MS = 3000
+# Response header carrying the store generation (incremented on every clear)
+MESSAGES_GENERATION_HEADER = "X-Messages-Generation"
 
 RESPONSE_STATUS_CODE_SUCCESS = 200
+RESPONSE_STATUS_CODE_NOT_MODIFIED = 304
+RESPONSE_STATUS_CODE_BAD_REQUEST = 400
 RESPONSE_STATUS_CODE_NOT_FOUND = 404
 RESPONSE_STATUS_CODE_ERROR = 500
+RESPONSE_STATUS_CODE_SERVICE_UNAVAILABLE = 503
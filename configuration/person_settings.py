@@ -27,16 +27,54 @@ WHISPER_MODEL_NAME = "RoachLin/kotoba-whisper-v2.2-faster"
 
 PERSONALITY_CORE_SIGNATURE = "[PersonalityCore]"
 USE_ELYZA_JP_MODEL = True
+# Model quantizations published for both models
+LLM_QUANTS = ("Q4_K_M", "Q4_K_S", "IQ4_XS", "Q3_K_M")
+# Model quantization, one of LLM_QUANTS.
+# Decoding is memory-bandwidth bound, so smaller quants generate faster.
+LLM_QUANT = "Q4_K_M"
+if LLM_QUANT not in LLM_QUANTS:
+    # Any other value would build a download URL that does not exist
+    raise ValueError(
+        f"Unsupported LLM_QUANT {LLM_QUANT!r}; expected one of {', '.join(LLM_QUANTS)}")
 if USE_ELYZA_JP_MODEL:
-    LLM_MODEL_PATH = "./llm/Llama-3-ELYZA-JP-8B-q4_k_m.gguf"
-    LLM_MODEL_DOWNLOAD_PATH = "https://huggingface.co/elyza/Llama-3-ELYZA-JP-8B-GGUF/resolve/main/Llama-3-ELYZA-JP-8B-q4_k_m.gguf"
+    if LLM_QUANT == "Q4_K_M":
+        LLM_MODEL_PATH = "./llm/Llama-3-ELYZA-JP-8B-q4_k_m.gguf"
+        LLM_MODEL_DOWNLOAD_PATH = "https://huggingface.co/elyza/Llama-3-ELYZA-JP-8B-GGUF/resolve/main/Llama-3-ELYZA-JP-8B-q4_k_m.gguf"
+    else:
+        LLM_MODEL_PATH = f"./llm/Llama-3-ELYZA-JP-8B-{LLM_QUANT}.gguf"
+        LLM_MODEL_DOWNLOAD_PATH = f"https://huggingface.co/mmnga/Llama-3-ELYZA-JP-8B-gguf/resolve/main/Llama-3-ELYZA-JP-8B-{LLM_QUANT}.gguf"
 else:
-    LLM_MODEL_PATH = "./llm/gemma-3-4b-it-Q4_K_M.gguf"
-    LLM_MODEL_DOWNLOAD_PATH = "https://huggingface.co/ggml-org/gemma-3-4b-it-GGUF/resolve/main/gemma-3-4b-it-Q4_K_M.gguf"
+    if LLM_QUANT == "Q4_K_M":
+        LLM_MODEL_PATH = "./llm/gemma-3-4b-it-Q4_K_M.gguf"
+        LLM_MODEL_DOWNLOAD_PATH = "https://huggingface.co/ggml-org/gemma-3-4b-it-GGUF/resolve/main/gemma-3-4b-it-Q4_K_M.gguf"
+    else:
+        LLM_MODEL_PATH = f"./llm/gemma-3-4b-it-{LLM_QUANT}.gguf"
+        LLM_MODEL_DOWNLOAD_PATH = f"https://huggingface.co/unsloth/gemma-3-4b-it-GGUF/resolve/main/gemma-3-4b-it-{LLM_QUANT}.gguf"
 
 LLM_N_CTX = 16384
 LLM_N_THREADS = 8
 LLM_N_GPU_LAYERS = -1
+LLM_USE_MMAP = True
+LLM_USE_MLOCK = False
+LLM_FLASH_ATTN = True
+LLM_OFFLOAD_KQV = True
+# KV cache element type ("f16", "q8_0", "q4_0"); quantized types need flash attention
+LLM_KV_CACHE_TYPE = "q8_0"
+# RAM budget for llama.cpp prompt (KV state) cache; 0 disables it.
+# The loaded context already reuses its longest matching token prefix, so a
+# single conversation never benefits, while the cache copies the KV state to
+# RAM after every completion. Only enable it when several conversations
+# (e.g. different system prompts) alternate on one model
+LLM_PROMPT_CACHE_BYTES = 0
+# Maximum number of user/assistant turns kept in the conversation history;
+# once exceeded, the history is cut back to half of it in one step
+LLM_MAX_HISTORY_TURNS = 20
+# Number of replies remembered per (system prompt, normalized user input) pair
+# and replayed without running the model; 0 disables it. Replies are normally
+# sampled and depend on the conversation so far, so this is opt-in
+LLM_RESPONSE_CACHE_SIZE = 0
+# Number of entries kept in each of the runner's input/output history logs
+RUNNER_MAX_HISTORY_ENTRIES = 4096
 
 # Whisper Model Settings
 WHISPER_TRANSCRIBE_PREFIX = "Whisper Transcribe Output:"
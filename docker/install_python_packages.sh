@@ -8,6 +8,8 @@ python3 -m venv /opt/venv_python_CodeneAria
 /opt/venv_python_CodeneAria/bin/pip install \
     requests \
     Flask \
+    waitress \
+    orjson \
     simpleaudio \
     pytest \
     pyyaml \
@@ -12,12 +12,17 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 sys.path.append(str(Path(__file__).resolve().parents[2]))
 
-from typing import Optional, Generator, Callable
-import urllib.request
+import collections
+import os
+import queue
+import re
 import shutil
-import subprocess
+import threading
+import unicodedata
+from typing import TYPE_CHECKING, Optional, Generator, Callable
 
-from llama_cpp import Llama
+if TYPE_CHECKING:
+    from llama_cpp import Llama
 
 from source.core.prompt_generator import PromptGenerator
 
@@ -27,10 +32,76 @@ from configuration.person_settings import (
     LLM_N_CTX,
     LLM_N_THREADS,
     LLM_N_GPU_LAYERS,
+    LLM_USE_MMAP,
+    LLM_USE_MLOCK,
+    LLM_FLASH_ATTN,
+    LLM_OFFLOAD_KQV,
+    LLM_KV_CACHE_TYPE,
+    LLM_MAX_HISTORY_TURNS,
+    LLM_PROMPT_CACHE_BYTES,
+    LLM_RESPONSE_CACHE_SIZE,
     PERSONALITY_CORE_SIGNATURE,
 )
 
-SENTENCE_ENDINGS = ['。', '！', '？', '!', '?']
+MODEL_PREFETCH_CHUNK_SIZE = 16 * 1024 * 1024
+MODEL_DOWNLOAD_BLOCK_SIZE = 8 * 1024 * 1024
+HTTP_STATUS_PARTIAL_CONTENT = 206
+HTTP_STATUS_RANGE_NOT_SATISFIABLE = 416
+SENTENCE_QUEUE_MAX_SIZE = 8
+# GGML types accepted for the K/V cache; "f16" is llama.cpp's default
+KV_CACHE_TYPES: frozenset[str] = frozenset(
+    {"f32", "f16", "bf16", "q8_0", "q5_1", "q5_0", "q4_1", "q4_0", "iq4_nl"})
+DEFAULT_KV_CACHE_TYPE = "f16"
+# Load errors that can come from flash attention / KV cache type support.
+# These options only affect context creation, so failures to load the
+# model weights (missing or corrupt GGUF, out of memory) are not retried
+ATTENTION_ERROR_PATTERN = re.compile(
+    r"llama_context|flash|type_[kv]|kv cache", re.IGNORECASE)
+
+SENTENCE_ENDINGS: frozenset[str] = frozenset("。！？!?")
+# Runs of sentence-ending characters (e.g. "！？") are treated as one boundary
+SENTENCE_ENDING_PATTERN = re.compile(
+    "[" + "".join(re.escape(ending) for ending in sorted(SENTENCE_ENDINGS)) + "]+")
+
+# Characters ignored when matching user inputs against the reply cache
+CACHE_KEY_IGNORED_PATTERN = re.compile(r"[\s\W_]+")
+
+
+def normalize_cache_key(text: str) -> str:
+    """Reduce user input to a form that matches trivially different spellings.
+
+    Width/compatibility forms are unified (NFKC), case is folded and
+    whitespace, punctuation and symbols are dropped, so e.g. "こんにちは！"
+    and "こんにちは" share a reply cache entry.
+
+    Args:
+        text: User input text.
+
+    Returns:
+        The normalized key text.
+    """
+    return CACHE_KEY_IGNORED_PATTERN.sub(
+        "", unicodedata.normalize("NFKC", text).casefold())
+
+
+def split_sentences(buffer: str) -> tuple[list[str], str]:
+    """Split buffer into complete sentences and the trailing remainder.
+
+    Args:
+        buffer: Text buffer to split.
+
+    Returns:
+        Tuple of (stripped complete sentences, text after the last boundary).
+    """
+    sentences = []
+    start = 0
+    for match in SENTENCE_ENDING_PATTERN.finditer(buffer):
+        sentence = buffer[start:match.end()].strip()
+        if sentence:
+            sentences.append(sentence)
+        start = match.end()
+
+    return sentences, buffer[start:]
 
 
 class PersonalityCoreManager:
@@ -47,6 +118,16 @@ class PersonalityCoreManager:
         n_ctx: int = LLM_N_CTX,
         n_threads: int = LLM_N_THREADS,
         n_gpu_layers: int = LLM_N_GPU_LAYERS,
+        use_mmap: bool = LLM_USE_MMAP,
+        use_mlock: bool = LLM_USE_MLOCK,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        max_history_turns: int = LLM_MAX_HISTORY_TURNS,
+        system_prompt: Optional[str] = None,
+        prompt_cache_bytes: int = LLM_PROMPT_CACHE_BYTES,
+        flash_attn: bool = LLM_FLASH_ATTN,
+        offload_kqv: bool = LLM_OFFLOAD_KQV,
+        kv_cache_type: str = LLM_KV_CACHE_TYPE,
+        response_cache_size: int = LLM_RESPONSE_CACHE_SIZE,
     ):
         """Initialize PersonalityCoreManager.
 
@@ -55,13 +136,52 @@ class PersonalityCoreManager:
             n_ctx: Context window size.
             n_threads: Number of CPU threads to use.
             n_gpu_layers: Number of layers to offload to GPU (-1 for all).
+            use_mmap: Memory-map the model file instead of copying it into RAM.
+            use_mlock: Lock the model pages in RAM to prevent swapping.
+            on_progress: Optional callback invoked during model download with
+                (downloaded_bytes, total_bytes); total_bytes is 0 if unknown.
+            max_history_turns: Maximum number of user/assistant turns kept
+                after the system prompt.
+            system_prompt: Optional instructions appended to the generated
+                pre-prompt in the system message.
+            prompt_cache_bytes: Capacity of the in-RAM prompt state cache
+                (0 disables it). Only useful when several conversations
+                alternate on one model.
+            flash_attn: Use flash attention kernels.
+            offload_kqv: Keep the KV cache on the GPU.
+            kv_cache_type: GGML type of the K/V cache (e.g. "f16", "q8_0").
+            response_cache_size: Number of replies remembered per
+                (system prompt, normalized user input) pair and replayed
+                without running the model (0 disables it).
+
+        Raises:
+            ValueError: If kv_cache_type is not one of KV_CACHE_TYPES.
         """
+        if kv_cache_type.lower() not in KV_CACHE_TYPES:
+            raise ValueError(
+                f"Unknown KV cache type {kv_cache_type!r}; expected one of "
+                f"{', '.join(sorted(KV_CACHE_TYPES))}")
         self.model_path = model_path
         self.n_ctx = n_ctx
         self.n_threads = n_threads
         self.n_gpu_layers = n_gpu_layers
-        self.system_prompt = PromptGenerator().generate_pre_prompt()
-        # self.system_prompt = ""
+        self.use_mmap = use_mmap
+        self.use_mlock = use_mlock
+        self.on_progress = on_progress or self._print_download_progress
+        self.max_history_turns = max_history_turns
+        self.prompt_cache_bytes = prompt_cache_bytes
+        self.flash_attn = flash_attn
+        self.offload_kqv = offload_kqv
+        self.kv_cache_type = kv_cache_type
+        self.response_cache_size = response_cache_size
+        # LRU of (system prompt, normalize_cache_key(user input)) -> reply
+        self._response_cache: collections.OrderedDict[tuple[str, str], str] = (
+            collections.OrderedDict())
+        # The pre-prompt is generated once; turns reuse the system message
+        self.prompt_generator = PromptGenerator()
+        self.pre_prompt = self.prompt_generator.generate_pre_prompt()
+        self.system_instructions = system_prompt
+        self.system_prompt = self._build_system_prompt()
 
         self.llm: Optional[Llama] = None
         self.messages: list[dict] = []
@@ -70,6 +190,12 @@ class PersonalityCoreManager:
         # Callback for sentence completion (for voice synthesis)
         self.on_sentence_complete: Optional[Callable[[str], None]] = None
 
+        # Completed sentences are handed to the callback on a worker thread
+        # so slow consumers (e.g. TTS requests) do not stall token streaming
+        self._sentence_queue: queue.Queue = queue.Queue(
+            maxsize=SENTENCE_QUEUE_MAX_SIZE)
+        self._sentence_thread: Optional[threading.Thread] = None
+
     def start(self) -> bool:
         """Load and initialize the Llama model.
 
@@ -84,15 +210,57 @@ class PersonalityCoreManager:
         if not self._ensure_model_exists():
             return False
 
+        # Warm the page cache in the background while llama.cpp initializes
+        threading.Thread(
+            target=self._prefetch_model_file,
+            args=(self.model_path,),
+            daemon=True
+        ).start()
+
         try:
+            # Imported here so config/prompt-only users skip loading llama.cpp
+            import llama_cpp
+            from llama_cpp import Llama, LlamaRAMCache
+
             print(
                 f"{PERSONALITY_CORE_SIGNATURE} Loading model from {self.model_path}...")
-            self.llm = Llama(
+            llama_kwargs = dict(
                 model_path=self.model_path,
                 n_ctx=self.n_ctx,
                 n_threads=self.n_threads,
                 n_gpu_layers=self.n_gpu_layers,
+                use_mmap=self.use_mmap,
+                use_mlock=self.use_mlock,
             )
+            # Only options that differ from llama.cpp's defaults are passed
+            attention_kwargs = {}
+            if self.flash_attn:
+                attention_kwargs["flash_attn"] = True
+            if not self.offload_kqv:
+                attention_kwargs["offload_kqv"] = False
+            if self.kv_cache_type.lower() != DEFAULT_KV_CACHE_TYPE:
+                kv_type = getattr(
+                    llama_cpp, f"GGML_TYPE_{self.kv_cache_type.upper()}")
+                attention_kwargs.update(type_k=kv_type, type_v=kv_type)
+
+            if attention_kwargs:
+                try:
+                    self.llm = Llama(**llama_kwargs, **attention_kwargs)
+                except Exception as e:
+                    if not ATTENTION_ERROR_PATTERN.search(str(e)):
+                        raise
+                    # Backends without flash attention / quantized KV support
+                    print(
+                        f"{PERSONALITY_CORE_SIGNATURE} Failed to create the context with {', '.join(attention_kwargs)} ({e}), retrying with defaults...", file=sys.stderr)
+                    self.llm = Llama(**llama_kwargs)
+            else:
+                self.llm = Llama(**llama_kwargs)
+            # Keep KV states of evaluated prompts so alternating
+            # conversations can restore their prefix; a single conversation
+            # is already served by the context's own prefix reuse
+            if self.prompt_cache_bytes > 0:
+                self.llm.set_cache(LlamaRAMCache(
+                    capacity_bytes=self.prompt_cache_bytes))
             print(f"{PERSONALITY_CORE_SIGNATURE} Model loaded successfully")
 
             # Initialize conversation with system prompt
@@ -100,6 +268,9 @@ class PersonalityCoreManager:
                 {"role": "system", "content": self.system_prompt}
             ]
             self.is_running = True
+            self._sentence_thread = threading.Thread(
+                target=self._sentence_worker_loop, daemon=True)
+            self._sentence_thread.start()
             return True
 
         except Exception as e:
@@ -107,6 +278,27 @@ class PersonalityCoreManager:
                 f"{PERSONALITY_CORE_SIGNATURE} Failed to load model: {e}", file=sys.stderr)
             return False
 
+    def _prefetch_model_file(self, path: str) -> None:
+        """Read the model file into the OS page cache.
+
+        Args:
+            path: Path to the model file.
+        """
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
+
+        try:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            while os.read(fd, MODEL_PREFETCH_CHUNK_SIZE):
+                pass
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
     def _ensure_model_exists(self) -> bool:
         """Ensure the model file exists locally; download if missing.
 
@@ -122,10 +314,8 @@ class PersonalityCoreManager:
             model_file.parent.mkdir(parents=True, exist_ok=True)
             print(
                 f"{PERSONALITY_CORE_SIGNATURE} Model not found at {self.model_path}, downloading from {download_url}...")
-            download_command = f"curl -L -C - -o {self.model_path} {download_url}"
-            print(
-                f"{PERSONALITY_CORE_SIGNATURE} Model not found. Downloading using command: {download_command}")
-            subprocess.run(download_command, shell=True, check=True)
+            self._download_model(download_url, model_file)
+            print(f"{PERSONALITY_CORE_SIGNATURE} Model downloaded")
 
             return True
         except Exception as e:
@@ -133,9 +323,162 @@ class PersonalityCoreManager:
                 f"{PERSONALITY_CORE_SIGNATURE} Failed to download model: {e}", file=sys.stderr)
             return False
 
+    def _download_model(self, url: str, destination: Path) -> None:
+        """Download the model, resuming a previous partial download if any.
+
+        Data is streamed into a ``.part`` file next to the destination, which
+        is renamed into place only once the download is complete. ``file://``
+        URLs (local mirrors) are copied without going through HTTP.
+
+        Args:
+            url: URL to download from.
+            destination: Final path of the model file.
+        """
+        import urllib3
+        from urllib.parse import urlparse
+        from urllib.request import url2pathname
+
+        part_file = destination.with_name(destination.name + ".part")
+
+        # Local mirrors: let the kernel copy the file (sendfile/copy_file_range)
+        parsed_url = urlparse(url)
+        if parsed_url.scheme == "file":
+            shutil.copyfile(url2pathname(parsed_url.path), part_file)
+            os.replace(part_file, destination)
+            return
+
+        offset = part_file.stat().st_size if part_file.exists() else 0
+
+        # GGUF data is already compressed; avoid transfer-encoding overhead
+        headers = {"Accept-Encoding": "identity"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+
+        http = urllib3.PoolManager(
+            retries=urllib3.Retry(total=3, backoff_factor=0.5))
+        response = http.request(
+            "GET", url, headers=headers, preload_content=False)
+        if offset and response.status == HTTP_STATUS_RANGE_NOT_SATISFIABLE:
+            # The offset is at or past the end of the remote file; the
+            # partial file is complete only if the sizes match
+            # (Content-Range: bytes */<size>)
+            content_range = response.headers.get("Content-Range", "")
+            response.release_conn()
+            remote_size = content_range.rpartition("/")[2]
+            if remote_size.isdigit() and int(remote_size) == offset:
+                os.replace(part_file, destination)
+                return
+            # The partial file does not match the remote file (e.g. it
+            # changed upstream); discard it and download from scratch
+            part_file.unlink()
+            self._download_model(url, destination)
+            return
+
+        try:
+            if response.status >= 400:
+                raise IOError(f"HTTP {response.status} while downloading {url}")
+            if offset and response.status != HTTP_STATUS_PARTIAL_CONTENT:
+                # Server ignored the range request; start over
+                offset = 0
+
+            content_length = response.headers.get("Content-Length")
+            expected_size = offset + \
+                int(content_length) if content_length is not None else None
+
+            downloaded = offset
+            total = expected_size or 0
+            with open(part_file, "ab" if offset else "wb") as f:
+                while True:
+                    block = response.read(MODEL_DOWNLOAD_BLOCK_SIZE)
+                    if not block:
+                        break
+                    f.write(block)
+                    downloaded += len(block)
+                    self.on_progress(downloaded, total)
+                # Make the data durable before the rename publishes it
+                f.flush()
+                os.fsync(f.fileno())
+        finally:
+            response.release_conn()
+
+        actual_size = part_file.stat().st_size
+        if expected_size is not None and actual_size != expected_size:
+            raise IOError(
+                f"Incomplete download: {actual_size} of {expected_size} bytes")
+
+        os.replace(part_file, destination)
+
+    def _print_download_progress(self, downloaded: int, total: int) -> None:
+        """Default download progress reporter that prints to stdout.
+
+        Args:
+            downloaded: Number of bytes downloaded so far.
+            total: Total number of bytes, or 0 if unknown.
+        """
+        downloaded_mib = downloaded / (1024 * 1024)
+        if total:
+            percent = downloaded * 100 / total
+            message = f"{downloaded_mib:.0f}/{total / (1024 * 1024):.0f} MiB ({percent:.1f}%)"
+        else:
+            message = f"{downloaded_mib:.0f} MiB"
+        end = "\n" if total and downloaded >= total else ""
+        print(
+            f"\r{PERSONALITY_CORE_SIGNATURE} Downloading model: {message}", end=end, flush=True)
+
+    def _sentence_worker_loop(self) -> None:
+        """Worker thread loop that delivers completed sentences to the callback."""
+        while True:
+            sentence = self._sentence_queue.get()
+            if sentence is None:
+                break
+            if self.on_sentence_complete:
+                try:
+                    self.on_sentence_complete(sentence)
+                except Exception as e:
+                    print(
+                        f"{PERSONALITY_CORE_SIGNATURE} Sentence callback error: {e}", file=sys.stderr)
+
+    def _emit_sentence(self, sentence: str) -> None:
+        """Deliver a completed sentence to on_sentence_complete.
+
+        Sentences are queued for the worker thread when it is running and
+        delivered synchronously otherwise.
+
+        Args:
+            sentence: The completed sentence text.
+        """
+        if self._sentence_thread is not None:
+            self._sentence_queue.put(sentence)
+        elif self.on_sentence_complete:
+            self.on_sentence_complete(sentence)
+
+    def clear_pending_sentences(self) -> None:
+        """Drop sentences queued for on_sentence_complete but not yet delivered.
+
+        Used when voice output is cleared or stopped, so sentences still
+        waiting behind a slow TTS request are not spoken afterwards. A
+        sentence already being delivered is not interrupted.
+        """
+        while True:
+            try:
+                sentence = self._sentence_queue.get_nowait()
+            except queue.Empty:
+                return
+            if sentence is None:
+                # Keep the worker's stop request
+                self._sentence_queue.put(None)
+                return
+
     def stop(self) -> None:
         """Stop and cleanup the Llama model."""
         self.is_running = False
+        if self._sentence_thread is not None:
+            try:
+                self._sentence_queue.put(None, timeout=5)
+            except queue.Full:
+                pass
+            self._sentence_thread.join(timeout=5)
+            self._sentence_thread = None
         if self.llm is not None:
             try:
                 self.llm.close()
@@ -150,6 +493,27 @@ class PersonalityCoreManager:
             {"role": "system", "content": self.system_prompt}
         ]
 
+    def _build_system_prompt(self) -> str:
+        """Combine the pre-prompt and optional instructions into the system prompt.
+
+        Returns:
+            The system prompt text.
+        """
+        if self.system_instructions:
+            return f"{self.pre_prompt}\n\n{self.system_instructions}"
+        return self.pre_prompt
+
+    def reload_pre_prompt(self) -> None:
+        """Regenerate the pre-prompt from the prompt files.
+
+        The system message is replaced in place; the rest of the
+        conversation history is kept.
+        """
+        self.pre_prompt = self.prompt_generator.generate_pre_prompt()
+        self.system_prompt = self._build_system_prompt()
+        if self.messages:
+            self.messages[0] = {"role": "system", "content": self.system_prompt}
+
     def add_user_message(self, text: str) -> None:
         """Add a user message to the conversation history.
 
@@ -167,7 +531,8 @@ class PersonalityCoreManager:
 
         If user_input is provided, it will be added to the history first.
         Yields text chunks as they are generated and calls on_sentence_complete
-        callback when a sentence boundary (。！？) is detected.
+        callback when a sentence boundary (。！？) is detected. Once the model
+        is started, the callback runs on a worker thread.
 
         Args:
             user_input: Optional user input to add before generating.
@@ -184,14 +549,28 @@ class PersonalityCoreManager:
         if user_input:
             self.add_user_message(user_input)
 
-        # Create streaming completion
+        cache_key = None
+        normalized_input = (normalize_cache_key(user_input)
+                            if user_input and self.response_cache_size > 0 else "")
+        if normalized_input:
+            cache_key = (self.system_prompt, normalized_input)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
+                return (yield from self._replay_response(cached))
+
+        # Create streaming completion. llama.cpp keeps the tokens of the
+        # previous turn in its context and only evaluates the part after the
+        # longest matching prefix, so the system prompt and unchanged history
+        # are not prefilled again (see _compact_history)
         stream = self.llm.create_chat_completion(
             messages=self.messages,
             stream=True
         )
 
-        assistant_text = ""
-        sentence_buffer = ""
+        parts: list[str] = []
+        # Fragments of the sentence in progress; joined only at a boundary
+        sentence_parts: list[str] = []
 
         for chunk in stream:
             if not self.is_running:
@@ -200,40 +579,91 @@ class PersonalityCoreManager:
             delta = chunk["choices"][0]["delta"]
             if "content" in delta:
                 text_chunk = delta["content"]
-                assistant_text += text_chunk
-                sentence_buffer += text_chunk
+                parts.append(text_chunk)
 
                 # Yield the chunk for immediate output
                 yield text_chunk
 
-                sentence_endings = SENTENCE_ENDINGS
-                if any(ending in text_chunk for ending in sentence_endings):
-                    # Find the last sentence-ending character position in the buffer
-                    last_pos = -1
-                    for ending in sentence_endings:
-                        pos = sentence_buffer.rfind(ending)
-                        if pos > last_pos:
-                            last_pos = pos
+                # Only the new chunk is scanned for sentence boundaries
+                start = 0
+                for match in SENTENCE_ENDING_PATTERN.finditer(text_chunk):
+                    sentence_parts.append(text_chunk[start:match.end()])
+                    start = match.end()
 
-                    if last_pos != -1:
-                        complete_sentences = sentence_buffer[:last_pos + 1]
-                        sentence_buffer = sentence_buffer[last_pos + 1:]
+                    sentence = "".join(sentence_parts).strip()
+                    sentence_parts = []
+                    if sentence:
+                        self._emit_sentence(sentence)
 
-                        if self.on_sentence_complete:
-                            self.on_sentence_complete(
-                                complete_sentences.strip())
+                if start < len(text_chunk):
+                    sentence_parts.append(text_chunk[start:])
 
         # Process any remaining text in buffer
-        if sentence_buffer.strip() and self.on_sentence_complete:
-            self.on_sentence_complete(sentence_buffer.strip())
+        remaining = "".join(sentence_parts).strip()
+        if remaining:
+            self._emit_sentence(remaining)
 
         # Add complete response to history
+        assistant_text = "".join(parts)
         if assistant_text:
             self.messages.append(
                 {"role": "assistant", "content": assistant_text})
+        self._compact_history()
+
+        # Only complete replies are cached (not ones cut short by stop())
+        if cache_key is not None and assistant_text and self.is_running:
+            self._response_cache[cache_key] = assistant_text
+            if len(self._response_cache) > self.response_cache_size:
+                self._response_cache.popitem(last=False)
 
         return assistant_text
 
+    def _replay_response(self, text: str) -> Generator[str, None, str]:
+        """Deliver a cached reply as if it had just been generated.
+
+        Args:
+            text: The cached assistant reply.
+
+        Yields:
+            The reply text as a single chunk.
+
+        Returns:
+            The reply text.
+        """
+        yield text
+
+        sentences, remaining = split_sentences(text)
+        for sentence in sentences:
+            self._emit_sentence(sentence)
+        remaining = remaining.strip()
+        if remaining:
+            self._emit_sentence(remaining)
+
+        self.messages.append({"role": "assistant", "content": text})
+        self._compact_history()
+        return text
+
+    def _compact_history(self) -> None:
+        """Drop old turns once more than max_history_turns are kept.
+
+        The history is cut back to half of max_history_turns in one step
+        rather than by one turn per reply: every cut changes the tokens
+        right after the system prompt, so llama.cpp has to re-evaluate the
+        whole kept history, and cutting in large steps keeps the prompt
+        prefix stable for many turns between compactions.
+
+        The system prompt is always kept, and the kept history always starts
+        with a user message.
+        """
+        if len(self.messages) <= 2 * self.max_history_turns + 1:
+            return
+
+        keep_messages = 2 * max(1, self.max_history_turns // 2)
+        history = self.messages[-keep_messages:]
+        while history and history[0]["role"] != "user":
+            history.pop(0)
+        self.messages = [self.messages[0]] + history
+
     def _process_sentence_buffer(self, buffer: str) -> None:
         """Process buffer and call callback for complete sentences.
 
@@ -243,17 +673,7 @@ class PersonalityCoreManager:
         if not self.on_sentence_complete:
             return
 
-        # Split by sentence-ending characters
-        sentence_endings = SENTENCE_ENDINGS
-        sentences = []
-        current = ""
-
-        for char in buffer:
-            current += char
-            if char in sentence_endings:
-                if current.strip():
-                    sentences.append(current.strip())
-                current = ""
+        sentences, _ = split_sentences(buffer)
 
         # Call callback for each complete sentence (except the last incomplete one)
         for sentence in sentences:
@@ -268,16 +688,8 @@ class PersonalityCoreManager:
         Returns:
             Text after the last sentence boundary.
         """
-        sentence_endings = SENTENCE_ENDINGS
-
-        last_end_pos = -1
-        for i, char in enumerate(buffer):
-            if char in sentence_endings:
-                last_end_pos = i
-
-        if last_end_pos >= 0:
-            return buffer[last_end_pos + 1:]
-        return buffer
+        _, remaining = split_sentences(buffer)
+        return remaining
 
     def generate_response(self, user_input: str) -> str:
         """Generate a complete response from the model (non-streaming).
@@ -288,10 +700,7 @@ class PersonalityCoreManager:
         Returns:
             The complete assistant response text.
         """
-        response = ""
-        for chunk in self.generate_response_stream(user_input):
-            response += chunk
-        return response
+        return "".join(self.generate_response_stream(user_input))
 
     def get_messages(self) -> list[dict]:
         """Get a copy of the conversation history.
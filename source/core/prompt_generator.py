@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
@@ -13,6 +15,13 @@ from configuration.person_settings import (
 )
 
 
+@functools.lru_cache(maxsize=16)
+def _read_cached(path: str, mtime_ns: int) -> bytes:
+    """Read a prompt file; cached per (path, mtime) so edits are picked up."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
 class PromptGenerator:
     """Generate a pre-prompt for the LLM by concatenating three markdown files.
 
@@ -22,6 +31,8 @@ class PromptGenerator:
     - SCENE_SETTINGS_PATH
 
     The generator reads each file and joins them with blank lines.
+    File contents and the joined prompt are cached until a file's
+    modification time changes.
     """
 
     def __init__(
@@ -34,12 +45,17 @@ class PromptGenerator:
         self.person_path = person_path or PERSON_INFO_PATH
         self.scene_path = scene_path or SCENE_SETTINGS_PATH
 
-    def _read_file(self, path: str) -> str:
-        p = Path(path)
-        if not p.exists():
-            raise FileNotFoundError(f"Prompt file not found: {path}")
+        self._cached_mtimes: tuple[int, ...] | None = None
+        self._cached_prompt: str | None = None
+
+    def _stat_mtime(self, path: str) -> int:
+        try:
+            return Path(path).stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Prompt file not found: {path}") from None
 
-        return p.read_text(encoding="utf-8")
+    def _read_file(self, path: str) -> bytes:
+        return _read_cached(str(Path(path)), self._stat_mtime(path))
 
     def generate_pre_prompt(self) -> str:
         """Return the concatenated contents of the three prompt files.
@@ -47,15 +63,31 @@ class PromptGenerator:
         The order is world -> person -> scene. Sections are separated by
         two newlines.
         """
-        parts: list[str] = []
+        paths = (self.world_path, self.person_path, self.scene_path)
+        mtimes = tuple(self._stat_mtime(path) for path in paths)
+        if self._cached_prompt is not None and self._cached_mtimes == mtimes:
+            return self._cached_prompt
+
+        # Cache misses read the three files concurrently
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            world, person, scene = executor.map(self._read_file, paths)
+
+        parts: list[bytes] = []
+
+        parts.append("[世界観設定]".encode("utf-8"))
+        parts.append(world)
 
-        parts.append("[世界観設定]")
-        parts.append(self._read_file(self.world_path))
+        parts.append("[人物設定]".encode("utf-8"))
+        parts.append(person)
 
-        parts.append("[人物設定]")
-        parts.append(self._read_file(self.person_path))
+        parts.append("[シーン設定]".encode("utf-8"))
+        parts.append(scene)
 
-        parts.append("[シーン設定]")
-        parts.append(self._read_file(self.scene_path))
+        # Join as bytes so the whole prompt is decoded once
+        prompt_bytes = b"\n\n".join(part for part in parts if part)
 
-        return "\n\n".join(part for part in parts if part)
+        self._cached_mtimes = mtimes
+        # Normalize line endings as text-mode reads did
+        self._cached_prompt = prompt_bytes.decode(
+            "utf-8").replace("\r\n", "\n")
+        return self._cached_prompt
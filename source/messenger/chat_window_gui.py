@@ -11,28 +11,83 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 sys.path.append(str(Path(__file__).resolve().parents[2]))
 
+import array
+import bisect
+import collections
+import json
 import threading
+import time
 from pathlib import Path
 import logging
 
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, send_from_directory
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from source.messenger.message_source import MessageSource, normalize_source
 
 from configuration.communcation_settings import (
     MESSENGER_PORT,
+    MESSENGER_SERVER_THREADS,
+    MESSENGER_LONG_POLL_MAX_WAIT,
+    MESSENGER_MAX_STREAMS,
+    MESSENGER_STREAM_KEEPALIVE,
+    MESSENGER_STREAM_POLL_INTERVAL,
+    MESSENGER_STREAM_MAX_DURATION,
+    MESSENGER_STREAM_RETRY_MS,
+    MESSAGES_GENERATION_HEADER,
     HOSTNAME,
     RESPONSE_STATUS_CODE_SUCCESS,
+    RESPONSE_STATUS_CODE_BAD_REQUEST,
     RESPONSE_STATUS_CODE_ERROR,
+    RESPONSE_STATUS_CODE_SERVICE_UNAVAILABLE,
 )
 
 # Flask app
 flask_app = Flask(__name__)
+# Web UI directory, resolved once instead of per request
+GUI_DIRECTORY = Path(__file__).resolve().parent / "gui"
+
+
+def _dumps(obj) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 
-# In-memory message store
-messages: list[dict] = []
+def _json_response(obj, status: int) -> Response:
+    """Build a JSON response without going through flask.jsonify."""
+    return Response(_dumps(obj), status=status, mimetype="application/json")
+
+
+# In-memory message store, kept as parallel columns (index i is one message)
+message_ids: array.array = array.array("q")
+message_senders: list[str] = []
+message_texts: list[str] = []
+message_sources: list[str] = []
+# Ids increase monotonically, so message_ids is sorted and can be bisected
 next_id = 1
-messages_lock = threading.Lock()
+# Incremented by every clear; ids restart at 1, so clients holding a last
+# seen id use this to detect the reset
+messages_generation = 0
+# Notified whenever the store changes so readers can wait instead of polling
+messages_cv = threading.Condition()
+# Incremented on every store change; used to invalidate the cached JSON
+messages_revision = 0
+# (JSON bytes, revision) pair, swapped as one reference so readers can check
+# it without taking the lock
+_cached_messages: tuple[bytes, int] = (b"[]", 0)
+# Recent (revision, message id) changes for streaming deltas; id 0 marks a clear
+MESSAGE_CHANGE_LOG_SIZE = 1024
+message_changes: collections.deque[tuple[int, int]] = collections.deque(
+    maxlen=MESSAGE_CHANGE_LOG_SIZE)
+# Number of open /messages/stream connections (each holds a server thread)
+active_streams = 0
+active_streams_lock = threading.Lock()
 # Voice input state
 voice_input_active = False
 voice_input_lock = threading.Lock()
@@ -41,6 +96,53 @@ voice_output_stop_flag = False
 voice_output_stop_lock = threading.Lock()
 
 
+def _mark_store_changed(*message_ids: int) -> None:
+    """Record store changes and wake waiters once (caller must hold messages_cv).
+
+    Args:
+        *message_ids: Ids of the added or updated messages, or 0 for a clear.
+    """
+    global messages_revision
+    for message_id in message_ids:
+        messages_revision += 1
+        message_changes.append((messages_revision, message_id))
+    messages_cv.notify_all()
+
+
+def _message_at(index: int) -> dict:
+    """Build the message dict at a column index (caller must hold messages_cv)."""
+    return {"id": message_ids[index], "sender": message_senders[index],
+            "text": message_texts[index], "source": message_sources[index]}
+
+
+def _columns_from(start: int) -> tuple:
+    """Slice every column from an index onward (caller must hold messages_cv).
+
+    Slicing only copies references, so it is cheap enough to do under the
+    lock; the dicts are then built by _build_messages after releasing it.
+    """
+    return (message_ids[start:], message_senders[start:],
+            message_texts[start:], message_sources[start:])
+
+
+def _build_messages(columns: tuple) -> list[dict]:
+    """Build message dicts from column slices (no lock needed)."""
+    return [
+        {"id": message_id, "sender": sender, "text": text, "source": source}
+        for message_id, sender, text, source in zip(*columns)
+    ]
+
+
+def _messages_from(start: int) -> list[dict]:
+    """Build message dicts from a column index onward (caller must hold messages_cv)."""
+    return _build_messages(_columns_from(start))
+
+
+def _intern(value):
+    """Intern strings so repeated values share one object; pass others through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 def add_message_to_store(sender: str, text: str, source: str | MessageSource = MessageSource.SYSTEM.value) -> dict:
     """Add a message to the store and return the new message.
 
@@ -50,35 +152,197 @@ def add_message_to_store(sender: str, text: str, source: str | MessageSource = M
         source: Message source.
     """
     global next_id
-    # Normalize source to a canonical string and restrict to allowed values
+    # Normalize source to a canonical string and restrict to allowed values.
+    # Senders repeat across messages, so store one shared copy
+    sender = _intern(sender)
     source_str = normalize_source(source)
 
-    with messages_lock:
-        new_message = {"id": next_id, "sender": sender,
-                       "text": text, "source": source_str}
-        messages.append(new_message)
+    with messages_cv:
+        message_ids.append(next_id)
+        message_senders.append(sender)
+        message_texts.append(text)
+        message_sources.append(source_str)
         next_id += 1
-        return new_message
+        _mark_store_changed(next_id - 1)
+        return _message_at(len(message_ids) - 1)
+
+
+def add_messages_to_store(items: list[dict]) -> list[dict]:
+    """Add several messages under one lock acquisition and one notification.
+
+    Args:
+        items: Message dicts with "sender", "text" and optional "source".
+
+    Returns:
+        The new messages, in insertion order.
+    """
+    global next_id
+    entries = [(_intern(item.get("sender", "")), item.get("text", ""),
+                normalize_source(item.get("source", MessageSource.SYSTEM.value)))
+               for item in items]
+
+    with messages_cv:
+        start = len(message_ids)
+        first_id = next_id
+        for sender, text, source_str in entries:
+            message_ids.append(next_id)
+            message_senders.append(sender)
+            message_texts.append(text)
+            message_sources.append(source_str)
+            next_id += 1
+        if entries:
+            _mark_store_changed(*range(first_id, next_id))
+        return _messages_from(start)
+
+
+def validate_message_items(items) -> str | None:
+    """Check a bulk request's items before they are added to the store.
+
+    Args:
+        items: The decoded "items" value of the request.
+
+    Returns:
+        An error message, or None if every item is valid.
+    """
+    if not isinstance(items, list):
+        return '"items" must be a list'
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            return f"items[{index}] must be an object"
+        for key in ("sender", "text"):
+            if not isinstance(item.get(key, ""), str):
+                return f"items[{index}].{key} must be a string"
+    return None
 
 
 def get_messages_from_store() -> list[dict]:
     """Get all messages from the store."""
-    with messages_lock:
-        return messages.copy()
+    with messages_cv:
+        columns = _columns_from(0)
+    return _build_messages(columns)
+
+
+def get_messages_json() -> tuple[bytes, int]:
+    """Get all messages serialized as JSON, re-encoding only after changes.
+
+    Returns:
+        Tuple of (UTF-8 JSON bytes, store revision they were rendered at).
+    """
+    global _cached_messages
+    # Fast path: an up-to-date snapshot is returned without locking; the
+    # tuple is immutable, so bytes and revision always belong together
+    cached = _cached_messages
+    if cached[1] == messages_revision:
+        return cached
+    with messages_cv:
+        if _cached_messages[1] == messages_revision:
+            return _cached_messages
+        columns = _columns_from(0)
+        revision = messages_revision
+
+    # Encode outside the lock so writers are not blocked by serialization
+    snapshot = (_dumps(_build_messages(columns)), revision)
+    with messages_cv:
+        if revision > _cached_messages[1]:
+            _cached_messages = snapshot
+    return snapshot
+
+
+def _index_of(message_id: int) -> int:
+    """Return the column index for a message id, or -1 (caller must hold messages_cv)."""
+    index = bisect.bisect_left(message_ids, message_id)
+    if index < len(message_ids) and message_ids[index] == message_id:
+        return index
+    return -1
 
 
 def get_messages_since(last_id: int) -> list[dict]:
     """Get messages with id greater than last_id."""
-    with messages_lock:
-        return [msg for msg in messages if msg["id"] > last_id]
+    with messages_cv:
+        columns = _columns_from(bisect.bisect_right(message_ids, last_id))
+    return _build_messages(columns)
+
+
+def wait_for_messages_since(
+        last_id: int, timeout: float,
+        generation: int | None = None) -> tuple[list[dict], int]:
+    """Block until messages newer than last_id exist or timeout expires.
+
+    A clear ends the wait. If the store generation is not the caller's,
+    last_id belongs to a cleared store, so the call returns at once with
+    every current message; this also covers clears that happened between
+    two polls.
+
+    Args:
+        last_id: Id of the last message the caller has seen.
+        timeout: Maximum time to wait (seconds).
+        generation: Store generation last_id belongs to, or None for the
+            current one.
+
+    Returns:
+        Tuple of (messages with id greater than last_id, or all messages
+        after a generation change; empty on timeout, store generation).
+    """
+    with messages_cv:
+        if generation is None:
+            generation = messages_generation
+        messages_cv.wait_for(
+            lambda: next_id - 1 > last_id or messages_generation != generation,
+            timeout=timeout)
+        if messages_generation != generation:
+            last_id = 0
+        columns = _columns_from(bisect.bisect_right(message_ids, last_id))
+        generation = messages_generation
+    return _build_messages(columns), generation
+
+
+def wait_for_changes_since(revision: int, timeout: float) -> tuple[list[dict] | None, int]:
+    """Block until the store changes after revision or timeout expires.
+
+    Args:
+        revision: Store revision the caller has already seen.
+        timeout: Maximum time to wait (seconds).
+
+    Returns:
+        Tuple of (changed messages, current revision). The list is empty on
+        timeout, and None when the caller must reload the full history
+        (after a clear, or when the change log no longer reaches back).
+    """
+    with messages_cv:
+        messages_cv.wait_for(
+            lambda: messages_revision != revision, timeout=timeout)
+        if messages_revision == revision:
+            return [], revision
+        if not message_changes or message_changes[0][0] > revision + 1:
+            return None, messages_revision
+
+        changed_ids: dict[int, None] = {}
+        for change_revision, message_id in reversed(message_changes):
+            if change_revision <= revision:
+                break
+            if message_id == 0:
+                return None, messages_revision
+            changed_ids[message_id] = None
+
+        changed = []
+        for message_id in sorted(changed_ids):
+            index = _index_of(message_id)
+            if index >= 0:
+                changed.append(_message_at(index))
+        return changed, messages_revision
 
 
 def clear_messages() -> None:
     """Clear all messages from the store."""
-    global next_id
-    with messages_lock:
-        messages.clear()
+    global next_id, messages_generation
+    with messages_cv:
+        del message_ids[:]
+        message_senders.clear()
+        message_texts.clear()
+        message_sources.clear()
         next_id = 1
+        messages_generation += 1
+        _mark_store_changed(0)
 
 
 def update_message_in_store(message_id: int, new_text: str) -> dict | None:
@@ -91,11 +355,31 @@ def update_message_in_store(message_id: int, new_text: str) -> dict | None:
     Returns:
         The updated message dict, or None if not found.
     """
-    with messages_lock:
-        for msg in messages:
-            if msg["id"] == message_id:
-                msg["text"] = new_text
-                return msg.copy()
+    with messages_cv:
+        index = _index_of(message_id)
+        if index >= 0:
+            message_texts[index] = new_text
+            _mark_store_changed(message_id)
+            return _message_at(index)
+        return None
+
+
+def append_to_message_in_store(message_id: int, text: str) -> int | None:
+    """Append text to a message by its ID.
+
+    Args:
+        message_id: The ID of the message to extend.
+        text: Text to append.
+
+    Returns:
+        The new text length, or None if not found.
+    """
+    with messages_cv:
+        index = _index_of(message_id)
+        if index >= 0:
+            message_texts[index] += text
+            _mark_store_changed(message_id)
+            return len(message_texts[index])
         return None
 
 
@@ -143,18 +427,190 @@ def get_and_clear_voice_output_stop_flag() -> dict:
 
 @flask_app.route("/")
 def index():
-    # Serve the web UI from the `gui` folder next to this file
-    return send_from_directory("gui", "chat_window.html")
+    # Serve the web UI from the `gui` folder next to this file. The response
+    # carries an ETag/Last-Modified, and browsers revalidate on each load
+    # (304 Not Modified) so an updated page is never served stale
+    response = send_from_directory(GUI_DIRECTORY, "chat_window.html",
+                                   conditional=True)
+    response.cache_control.no_cache = True
+    return response
+
+
+def _messages_delta_response(messages: list[dict], revision: int | None = None,
+                             generation: int | None = None) -> Response:
+    """Build a since/wait response tagged with the store generation.
+
+    Args:
+        messages: Messages to return.
+        revision: Store revision read before the query, sent as the ETag.
+        generation: Store generation the messages were read at; the current
+            generation (read after the messages) if None.
+    """
+    response = _json_response(messages, RESPONSE_STATUS_CODE_SUCCESS)
+    if generation is None:
+        generation = messages_generation
+    response.headers[MESSAGES_GENERATION_HEADER] = str(generation)
+    if revision is not None:
+        response.set_etag(str(revision))
+    return response
 
 
 @flask_app.route('/messages', methods=['GET'])
 def get_messages():
-    """Endpoint to get all messages.
+    """Endpoint to get messages.
+
+    Query parameters:
+        since (int, optional): Only return messages with a greater id.
+        wait (float, optional): With ``since``, block up to this many seconds
+            until newer messages exist instead of returning an empty list.
+        generation (int, optional): With ``wait``, the store generation
+            ``since`` belongs to. If the store has been cleared since, the
+            request returns at once with all current messages.
 
     Response JSON format:
         [{"id": int, "sender": str, "text": str, "source": str}, ...]
+
+    The full-history and ``since`` responses carry an ETag of the store
+    revision; requests with a matching If-None-Match get 304 Not Modified.
+    For ``since`` polls a 304 means the store has not changed at all since
+    the tagged response, so there is nothing new. Every response carries
+    the store generation header, read after the messages so a clear racing
+    with the request is always reported.
+    """
+    since = request.args.get('since', default=0, type=int)
+    wait = request.args.get('wait', default=0.0, type=float)
+    if wait > 0:
+        messages, generation = wait_for_messages_since(
+            since, min(wait, MESSENGER_LONG_POLL_MAX_WAIT),
+            request.args.get('generation', type=int))
+        return _messages_delta_response(messages, generation=generation)
+    if since > 0:
+        # Read the revision before querying: a write racing with the query
+        # then changes the revision, so the next poll is answered in full
+        revision = messages_revision
+        if request.if_none_match.contains(str(revision)):
+            response = Response(status=304)
+            response.headers[MESSAGES_GENERATION_HEADER] = str(messages_generation)
+            response.set_etag(str(revision))
+            return response
+        return _messages_delta_response(get_messages_since(since), revision)
+
+    body, revision = get_messages_json()
+    response = Response(body, status=RESPONSE_STATUS_CODE_SUCCESS,
+                        mimetype="application/json")
+    response.headers[MESSAGES_GENERATION_HEADER] = str(messages_generation)
+    response.set_etag(str(revision))
+    # Make browsers revalidate every poll instead of reusing a stale copy
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+def _acquire_stream_slot() -> bool:
+    """Reserve one of the MESSENGER_MAX_STREAMS stream slots.
+
+    Returns:
+        True if a slot was reserved, False when the cap is reached.
+    """
+    global active_streams
+    with active_streams_lock:
+        if active_streams >= MESSENGER_MAX_STREAMS:
+            return False
+        active_streams += 1
+        return True
+
+
+def _release_stream_slot() -> None:
+    """Release a slot reserved by _acquire_stream_slot."""
+    global active_streams
+    with active_streams_lock:
+        active_streams -= 1
+
+
+def _snapshot_event() -> tuple[bytes, int]:
+    """Build a ``snapshot`` event of the whole store.
+
+    The data is ``{"generation": int, "messages": [...]}``. The generation
+    is read before and after the messages, so it always matches them.
+
+    Returns:
+        Tuple of (event bytes, store revision of the snapshot).
     """
-    return jsonify(get_messages_from_store()), RESPONSE_STATUS_CODE_SUCCESS
+    while True:
+        generation = messages_generation
+        body, revision = get_messages_json()
+        if generation == messages_generation:
+            break
+    return (b'event: snapshot\ndata: {"generation":%d,"messages":' % generation
+            + body + b"}\n\n"), revision
+
+
+def _message_events(client_disconnected=None):
+    """Yield Server-Sent Events for the message store.
+
+    The first event is a full ``snapshot`` (see _snapshot_event); after
+    that each ``messages`` event carries only the added or updated
+    messages. A new ``snapshot`` is sent after a clear or if the client
+    falls behind the change log.
+    The stream ends after MESSENGER_STREAM_MAX_DURATION seconds so the
+    worker thread is returned to the server; EventSource then reconnects.
+
+    Args:
+        client_disconnected: Callable returning True once the client has
+            gone away (waitress provides one), checked every
+            MESSENGER_STREAM_POLL_INTERVAL seconds. Without it a closed
+            connection is only noticed when the next keep-alive is written.
+    """
+    deadline = time.monotonic() + MESSENGER_STREAM_MAX_DURATION
+    event, revision = _snapshot_event()
+    yield b"retry: %d\n" % MESSENGER_STREAM_RETRY_MS + event
+    last_write = time.monotonic()
+    while True:
+        now = time.monotonic()
+        if now >= deadline:
+            return
+        changed, revision = wait_for_changes_since(
+            revision, min(MESSENGER_STREAM_POLL_INTERVAL, deadline - now))
+        if client_disconnected is not None and client_disconnected():
+            return
+        if changed is None:
+            event, revision = _snapshot_event()
+            yield event
+        elif changed:
+            yield b"event: messages\ndata: " + _dumps(changed) + b"\n\n"
+        elif time.monotonic() - last_write >= MESSENGER_STREAM_KEEPALIVE:
+            # Comment line keeps proxies from closing an idle stream and
+            # lets the server notice disconnected clients
+            yield b": keep-alive\n\n"
+        else:
+            continue
+        last_write = time.monotonic()
+
+
+@flask_app.route('/messages/stream', methods=['GET'])
+def stream_messages():
+    """Endpoint streaming message changes as Server-Sent Events.
+
+    At most MESSENGER_MAX_STREAMS streams are served at once, since each
+    one holds a server worker thread; further requests get 503 with a
+    ``retry:`` hint and the page falls back to polling.
+    """
+    if not _acquire_stream_slot():
+        response = Response(b"retry: %d\n\n" % MESSENGER_STREAM_RETRY_MS,
+                            status=RESPONSE_STATUS_CODE_SERVICE_UNAVAILABLE,
+                            mimetype="text/event-stream")
+        response.headers["Retry-After"] = str(
+            max(1, MESSENGER_STREAM_RETRY_MS // 1000))
+        return response
+
+    response = Response(
+        _message_events(request.environ.get("waitress.client_disconnected")),
+        mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    # Runs when the server closes the response, whether the stream ended,
+    # failed or was never iterated
+    response.call_on_close(_release_stream_slot)
+    return response
 
 
 @flask_app.route('/messages', methods=['POST'])
@@ -173,16 +629,44 @@ def post_message():
         text = data.get('text', '')
         source = data.get('source', 'system')
         new_message = add_message_to_store(sender, text, source)
-        return jsonify(new_message), 201
+        return _json_response(new_message, 201)
     except Exception as e:
-        return jsonify({"status": "error", "message": str(e)}), RESPONSE_STATUS_CODE_ERROR
+        return _json_response({"status": "error", "message": str(e)}, RESPONSE_STATUS_CODE_ERROR)
+
+
+@flask_app.route('/messages/bulk', methods=['POST'])
+def post_messages_bulk():
+    """Endpoint to post several messages at once.
+
+    Request JSON format:
+        {"items": [{"sender": str, "text": str, "source": str (optional)}, ...]}
+
+    Response JSON format:
+        [{"id": int, "sender": str, "text": str, "source": str}, ...]
+
+    Malformed requests are answered with 400 and nothing is added.
+    """
+    try:
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return _json_response({"status": "error", "message": "Request body must be a JSON object"},
+                                  RESPONSE_STATUS_CODE_BAD_REQUEST)
+        items = data.get('items', [])
+        error = validate_message_items(items)
+        if error is not None:
+            return _json_response({"status": "error", "message": error},
+                                  RESPONSE_STATUS_CODE_BAD_REQUEST)
+        new_messages = add_messages_to_store(items)
+        return _json_response(new_messages, 201)
+    except Exception as e:
+        return _json_response({"status": "error", "message": str(e)}, RESPONSE_STATUS_CODE_ERROR)
 
 
 @flask_app.route('/messages/clear', methods=['POST'])
 def clear_messages_endpoint():
     """Endpoint to clear all messages."""
     clear_messages()
-    return jsonify({"status": "success"}), RESPONSE_STATUS_CODE_SUCCESS
+    return _json_response({"status": "success"}, RESPONSE_STATUS_CODE_SUCCESS)
 
 
 @flask_app.route('/messages/<int:message_id>', methods=['PATCH'])
@@ -190,32 +674,40 @@ def update_message(message_id: int):
     """Endpoint to update an existing message.
 
     Request JSON format:
-        {"text": str}
+        {"text": str} to replace the text, or
+        {"append": str} to add to the end of it (used for streamed replies)
 
     Response JSON format:
-        {"id": int, "sender": str, "text": str}
+        {"id": int, "sender": str, "text": str}, or
+        {"id": int, "length": int} for appends, so the reply stays small
     """
     try:
         data = request.get_json() or {}
+        if 'append' in data:
+            length = append_to_message_in_store(message_id, data['append'])
+            if length is None:
+                return _json_response({"status": "error", "message": "Message not found"}, 404)
+            return _json_response({"id": message_id, "length": length}, RESPONSE_STATUS_CODE_SUCCESS)
+
         new_text = data.get('text', '')
         updated_msg = update_message_in_store(message_id, new_text)
         if updated_msg is None:
-            return jsonify({"status": "error", "message": "Message not found"}), 404
-        return jsonify(updated_msg), RESPONSE_STATUS_CODE_SUCCESS
+            return _json_response({"status": "error", "message": "Message not found"}, 404)
+        return _json_response(updated_msg, RESPONSE_STATUS_CODE_SUCCESS)
     except Exception as e:
-        return jsonify({"status": "error", "message": str(e)}), RESPONSE_STATUS_CODE_ERROR
+        return _json_response({"status": "error", "message": str(e)}, RESPONSE_STATUS_CODE_ERROR)
 
 
 @flask_app.route('/health', methods=['GET'])
 def health_check():
     """Endpoint for health check."""
-    return jsonify({"status": "ok"}), RESPONSE_STATUS_CODE_SUCCESS
+    return _json_response({"status": "ok"}, RESPONSE_STATUS_CODE_SUCCESS)
 
 
 @flask_app.route('/voice_input_state', methods=['GET'])
 def voice_input_state_get():
     """Return the voice input active state."""
-    return jsonify(get_voice_input_state()), RESPONSE_STATUS_CODE_SUCCESS
+    return _json_response(get_voice_input_state(), RESPONSE_STATUS_CODE_SUCCESS)
 
 
 @flask_app.route('/voice_input_state', methods=['POST'])
@@ -229,9 +721,9 @@ def voice_input_state_post():
         data = request.get_json() or {}
         active = bool(data.get('active', False))
         new_state = set_voice_input_state(active)
-        return jsonify(new_state), RESPONSE_STATUS_CODE_SUCCESS
+        return _json_response(new_state, RESPONSE_STATUS_CODE_SUCCESS)
     except Exception as e:
-        return jsonify({"status": "error", "message": str(e)}), RESPONSE_STATUS_CODE_ERROR
+        return _json_response({"status": "error", "message": str(e)}, RESPONSE_STATUS_CODE_ERROR)
 
 
 @flask_app.route('/voice_output_stop_flag', methods=['GET'])
@@ -239,7 +731,7 @@ def voice_output_stop_flag_get():
     """Return the voice output stop flag state."""
     # When the flag is polled by an external consumer, consume it so the
     # Stop Speak button can be reverted by the UI polling the same endpoint.
-    return jsonify(get_and_clear_voice_output_stop_flag()), RESPONSE_STATUS_CODE_SUCCESS
+    return _json_response(get_and_clear_voice_output_stop_flag(), RESPONSE_STATUS_CODE_SUCCESS)
 
 
 @flask_app.route('/voice_output_stop_flag', methods=['POST'])
@@ -253,9 +745,9 @@ def voice_output_stop_flag_post():
         data = request.get_json() or {}
         stop = bool(data.get('stop', False))
         new_state = set_voice_output_stop_flag(stop)
-        return jsonify(new_state), RESPONSE_STATUS_CODE_SUCCESS
+        return _json_response(new_state, RESPONSE_STATUS_CODE_SUCCESS)
     except Exception as e:
-        return jsonify({"status": "error", "message": str(e)}), RESPONSE_STATUS_CODE_ERROR
+        return _json_response({"status": "error", "message": str(e)}, RESPONSE_STATUS_CODE_ERROR)
 
 
 def run_flask_server(host: str, port: int) -> None:
@@ -269,8 +761,19 @@ def run_flask_server(host: str, port: int) -> None:
     log = logging.getLogger('werkzeug')
     log.setLevel(logging.ERROR)
 
-    # Run server (blocking); choose production server separately if needed
-    flask_app.run(host=host, port=port, debug=False, use_reloader=False)
+    # Prefer the multi-threaded waitress WSGI server; fall back to the
+    # werkzeug development server if it is not installed
+    try:
+        from waitress import serve
+    except ImportError:
+        flask_app.run(host=host, port=port, debug=False, use_reloader=False)
+        return
+
+    # A request lookahead keeps waitress reading from busy connections, so
+    # a closed stream is detected (waitress.client_disconnected) right away
+    serve(flask_app, host=host, port=port,
+          threads=MESSENGER_SERVER_THREADS, channel_request_lookahead=1,
+          _quiet=True)
 
 
 def main(host: str = HOSTNAME, port: int = MESSENGER_PORT) -> None:
@@ -7,9 +7,11 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 sys.path.append(str(Path(__file__).resolve().parents[2]))
 
+import queue
 import subprocess
 import time
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Union, Callable
 import requests
 
@@ -17,8 +19,11 @@ from configuration.communcation_settings import (
     MESSENGER_PORT,
     HOSTNAME,
     RESPONSE_STATUS_CODE_SUCCESS,
+    RESPONSE_STATUS_CODE_NOT_MODIFIED,
     RESPONSE_STATUS_CODE_NOT_FOUND,
     RESPONSE_STATUS_CODE_ERROR,
+    MESSAGES_GENERATION_HEADER,
+    MESSENGER_LISTEN_WAIT,
 )
 
 from source.messenger.message_source import MessageSource, normalize_source
@@ -50,12 +55,48 @@ class MessageManager:
 
         self.voice_input_active: bool = False
         self.voice_output_stop_flag: bool = False
-
-    def start(self, wait_time: float = 2.0) -> bool:
+        # Store generation from the last GET /messages; changes on every clear
+        self.messages_generation: Optional[int] = None
+        # (since, ETag) of the last since-poll. The ETag is the store
+        # revision, so a 304 only means "nothing new" for the same since
+        self._messages_etag: Optional[tuple[int, str]] = None
+
+        # One keep-alive session per calling thread (requests.Session is not
+        # thread-safe), so polls reuse the TCP connection to the server
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+
+        # Background sender for updates that must not block the caller. One
+        # worker keeps requests in submission order
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Latest still-queued request per message id: [kind, payload, future]
+        self._pending_requests: dict[int, list] = {}
+        self._pending_lock = threading.Lock()
+
+        # Filled by the listener thread with messages not yet consumed, and
+        # set when new messages (or a clear) arrive
+        self.pending_messages: queue.Queue = queue.Queue()
+        self.new_messages_event = threading.Event()
+        self._listener_thread: Optional[threading.Thread] = None
+        self._listener_stop = threading.Event()
+
+    @property
+    def _session(self) -> requests.Session:
+        """Return the HTTP session owned by the calling thread."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def start(self, wait_time: float = 5.0) -> bool:
         """Start ChatWindow subprocess.
 
         Args:
-            wait_time: Time to wait for server to start (seconds).
+            wait_time: Maximum time to wait for server to start (seconds).
 
         Returns:
             True if server started successfully, False otherwise.
@@ -74,39 +115,140 @@ class MessageManager:
                 text=True
             )
 
-            # Wait for server to start
-            time.sleep(wait_time)
+            # Poll the health endpoint until the server answers, rather than
+            # sleeping for a fixed time
+            deadline = time.monotonic() + wait_time
+            while True:
+                # Check if process is still running
+                if self.process.poll() is not None:
+                    print("ChatWindow process terminated unexpectedly")
+                    self.process = None
+                    return False
 
-            # Check if process is still running
-            if self.process.poll() is not None:
-                print("ChatWindow process terminated unexpectedly")
-                self.process = None
+                try:
+                    response = self._session.get(
+                        f"{self.base_url}/health", timeout=0.5)
+                    break
+                except requests.exceptions.RequestException:
+                    if time.monotonic() >= deadline:
+                        print("ChatWindow server is not responding")
+                        return False
+                    time.sleep(0.05)
+
+            if response.status_code != RESPONSE_STATUS_CODE_SUCCESS:
+                print(
+                    f"ChatWindow health check failed: {response.status_code}")
                 return False
 
-            # Verify server is responding
+            # initialize voice input state cache
             try:
-                response = requests.get(f"{self.base_url}/health", timeout=5)
-                if response.status_code != RESPONSE_STATUS_CODE_SUCCESS:
-                    print(
-                        f"ChatWindow health check failed: {response.status_code}")
-                    return False
-                # initialize voice input state cache
-                try:
-                    self.update_voice_input_state()
-                except Exception:
-                    # swallow; state can be polled later
-                    pass
-            except requests.exceptions.RequestException:
-                print("ChatWindow server is not responding")
-                return False
+                self.update_voice_input_state()
+            except Exception:
+                # swallow; state can be polled later
+                pass
 
             return True
         except Exception as e:
             print(f"Failed to start ChatWindow: {e}")
             return False
 
+    def start_message_listener(self) -> None:
+        """Start a thread that long-polls the server for new messages.
+
+        New messages are put on pending_messages and new_messages_event is
+        set, so callers can wait on the event and consume the queue with
+        take_pending_inputs() instead of polling the server themselves.
+        """
+        if self._listener_thread is not None and self._listener_thread.is_alive():
+            return
+        self._listener_stop.clear()
+        self._listener_thread = threading.Thread(
+            target=self._listen_loop, daemon=True)
+        self._listener_thread.start()
+
+    def _listen_loop(self) -> None:
+        """Listener thread loop: block on the server until messages arrive."""
+        last_id = 0
+        generation: Optional[str] = None
+        while not self._listener_stop.is_set():
+            # Any failure (e.g. a malformed reply) is logged and retried;
+            # letting it escape would end the thread and chat input with it
+            try:
+                last_id, generation = self._listen_once(last_id, generation)
+            except Exception as e:
+                print(f"Message listener error: {e}")
+                self._listener_stop.wait(1.0)
+
+    def _listen_once(self, last_id: int, generation: Optional[str]) -> tuple[int, Optional[str]]:
+        """Run one long-poll and queue the messages it returns.
+
+        Args:
+            last_id: Id of the last message queued so far.
+            generation: Store generation last_id belongs to (None at first).
+
+        Returns:
+            The updated (last_id, generation).
+        """
+        # Sending the generation makes the server answer at once with the
+        # whole store if it was cleared since the last poll
+        params = {"since": last_id, "wait": MESSENGER_LISTEN_WAIT}
+        if generation is not None:
+            params["generation"] = generation
+        try:
+            response = self._session.get(
+                f"{self.base_url}/messages",
+                params=params,
+                timeout=MESSENGER_LISTEN_WAIT + 5
+            )
+        except requests.exceptions.RequestException:
+            # Server not reachable; retry without spinning
+            self._listener_stop.wait(1.0)
+            return last_id, generation
+        if response.status_code != RESPONSE_STATUS_CODE_SUCCESS:
+            self._listener_stop.wait(1.0)
+            return last_id, generation
+
+        new_generation = response.headers.get(MESSAGES_GENERATION_HEADER)
+        messages = response.json()
+        if generation is not None and new_generation != generation:
+            # Cleared: ids restarted and the server returned the whole
+            # new store, so continue from its last id (or 0 if empty)
+            last_id = 0
+            self.new_messages_event.set()
+        if messages:
+            last_id = messages[-1].get("id", last_id)
+            for msg in messages:
+                self.pending_messages.put(msg)
+            self.new_messages_event.set()
+        return last_id, new_generation
+
+    def take_pending_inputs(self) -> list[tuple[str, str]]:
+        """Consume the messages queued by the listener and return user inputs.
+
+        Returns:
+            List of (text, source) inputs to process, in order (see
+            _collect_user_inputs).
+        """
+        messages = []
+        while True:
+            try:
+                messages.append(self.pending_messages.get_nowait())
+            except queue.Empty:
+                break
+        return self._collect_user_inputs(messages)
+
     def stop(self) -> None:
         """Stop ChatWindow subprocess."""
+        # The listener exits after its current long-poll returns
+        self._listener_stop.set()
+        self._listener_thread = None
+
+        # Deliver queued background updates before the server goes away
+        with self._pending_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
         if self.process is not None:
             self.process.terminate()
             try:
@@ -116,6 +258,12 @@ class MessageManager:
                 self.process.wait()
             self.process = None
 
+        with self._sessions_lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+        self._local = threading.local()
+
     def is_running(self) -> bool:
         """Check if ChatWindow process is running.
 
@@ -140,7 +288,7 @@ class MessageManager:
             Message ID if successful, None otherwise.
         """
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/messages",
                 json={"sender": sender, "text": text,
                       "source": normalize_source(source)},
@@ -154,6 +302,31 @@ class MessageManager:
             print(f"Failed to send message: {e}")
             return None
 
+    def send_messages(self, items: list[tuple[str, str, Union[str, MessageSource]]]) -> list[int]:
+        """Send several messages to the ChatWindow in one request.
+
+        Args:
+            items: (sender, text, source) tuples, in display order.
+
+        Returns:
+            Message IDs of the new messages, or empty list on error.
+        """
+        try:
+            response = self._session.post(
+                f"{self.base_url}/messages/bulk",
+                json={"items": [
+                    {"sender": sender, "text": text,
+                     "source": normalize_source(source)}
+                    for sender, text, source in items]},
+                timeout=5
+            )
+            if response.status_code == 201:
+                return [msg.get("id") for msg in response.json()]
+            return []
+        except requests.exceptions.RequestException as e:
+            print(f"Failed to send messages: {e}")
+            return []
+
     def update_message(self, message_id: int, text: str) -> bool:
         """Update an existing message in the ChatWindow.
 
@@ -165,7 +338,7 @@ class MessageManager:
             True if message was updated successfully, False otherwise.
         """
         try:
-            response = requests.patch(
+            response = self._session.patch(
                 f"{self.base_url}/messages/{message_id}",
                 json={"text": text},
                 timeout=5
@@ -175,18 +348,133 @@ class MessageManager:
             print(f"Failed to update message: {e}")
             return False
 
-    def get_messages(self) -> list[dict]:
-        """Get all messages from the ChatWindow.
+    def update_message_async(self, message_id: int, text: str) -> Future:
+        """Update a message in the background without blocking the caller.
+
+        Requests are sent in submission order. If the most recent request
+        for the same message is an update still waiting to be sent, its text
+        is replaced instead of queueing another request, so only the latest
+        text goes out.
+
+        Args:
+            message_id: The ID of the message to update.
+            text: New message text.
+
+        Returns:
+            Future resolving to True if the update was sent successfully.
+        """
+        return self._submit_pending(message_id, "text", text)
+
+    def _submit_pending(self, message_id: int, kind: str, text: str) -> Future:
+        """Queue an update ("text") or append ("append") for the sender thread.
+
+        The request is merged into the message's latest queued request only
+        if that one is of the same kind, so requests of the other kind
+        submitted in between keep their order.
+
+        Args:
+            message_id: The ID of the message to change.
+            kind: "text" to replace the text, "append" to extend it.
+            text: New text, or text to append.
+
+        Returns:
+            Future resolving to True if the request was sent successfully.
+        """
+        with self._pending_lock:
+            pending = self._pending_requests.get(message_id)
+            if pending is not None and pending[0] == kind:
+                if kind == "append":
+                    pending[1].append(text)
+                else:
+                    pending[1] = text
+                return pending[2]
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="MessageManager")
+            pending = [kind, [text] if kind == "append" else text, None]
+            self._pending_requests[message_id] = pending
+            pending[2] = self._executor.submit(
+                self._send_pending, message_id, pending)
+            return pending[2]
+
+    def _send_pending(self, message_id: int, pending: list) -> bool:
+        """Send one queued request (runs on the executor)."""
+        with self._pending_lock:
+            # Later requests can no longer be merged into this one
+            if self._pending_requests.get(message_id) is pending:
+                del self._pending_requests[message_id]
+            kind, payload = pending[0], pending[1]
+        if kind == "append":
+            return self.append_message(message_id, "".join(payload))
+        return self.update_message(message_id, payload)
+
+    def append_message(self, message_id: int, text: str) -> bool:
+        """Append text to an existing message in the ChatWindow.
+
+        Args:
+            message_id: The ID of the message to extend.
+            text: Text to append.
+
+        Returns:
+            True if the text was appended successfully, False otherwise.
+        """
+        try:
+            response = self._session.patch(
+                f"{self.base_url}/messages/{message_id}",
+                json={"append": text},
+                timeout=5
+            )
+            return response.status_code == RESPONSE_STATUS_CODE_SUCCESS
+        except requests.exceptions.RequestException as e:
+            print(f"Failed to append to message: {e}")
+            return False
+
+    def append_message_async(self, message_id: int, text: str) -> Future:
+        """Append text to a message in the background.
+
+        Shares the ordered sender with update_message_async. Consecutive
+        appends for a message that are still waiting to be sent are merged
+        into one request.
+
+        Args:
+            message_id: The ID of the message to extend.
+            text: Text to append.
+
+        Returns:
+            Future resolving to True if the text was appended successfully.
+        """
+        return self._submit_pending(message_id, "append", text)
+
+    def get_messages(self, since: int = 0) -> list[dict]:
+        """Get messages from the ChatWindow.
+
+        Args:
+            since: Only return messages with an id greater than this (0 for all).
 
         Returns:
             List of message dictionaries, or empty list on error.
         """
+        headers = None
+        if since and self._messages_etag is not None and self._messages_etag[0] == since:
+            headers = {"If-None-Match": self._messages_etag[1]}
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/messages",
+                params={"since": since} if since else None,
+                headers=headers,
                 timeout=5
             )
+            generation = response.headers.get(MESSAGES_GENERATION_HEADER)
+            if generation is not None:
+                self.messages_generation = int(generation)
+            if response.status_code == RESPONSE_STATUS_CODE_NOT_MODIFIED:
+                # Store unchanged since the last poll: nothing new to parse
+                return []
             if response.status_code == RESPONSE_STATUS_CODE_SUCCESS:
+                etag = response.headers.get("ETag")
+                if since and etag is not None:
+                    self._messages_etag = (since, etag)
                 return response.json()
             return []
         except requests.exceptions.RequestException as e:
@@ -200,7 +488,7 @@ class MessageManager:
             True if messages were cleared successfully, False otherwise.
         """
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/messages/clear",
                 timeout=5
             )
@@ -216,7 +504,7 @@ class MessageManager:
             True if server is healthy, False otherwise.
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/health",
                 timeout=5
             )
@@ -231,7 +519,7 @@ class MessageManager:
             The current voice input state (True if active).
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/voice_input_state", timeout=5)
             if response.status_code == RESPONSE_STATUS_CODE_SUCCESS:
                 data = response.json() or {}
@@ -242,6 +530,36 @@ class MessageManager:
             print(f"Failed to update voice input state: {e}")
             return False
 
+    @staticmethod
+    def _collect_user_inputs(messages: list[dict]) -> list[tuple[str, str]]:
+        """Select user messages and merge consecutive ones into single inputs.
+
+        Messages the user sent in a burst (e.g. while a reply was being
+        generated) become one input, so the model runs one generation for
+        them instead of one per message.
+
+        Args:
+            messages: Message dictionaries in id order.
+
+        Returns:
+            List of (text, source) inputs to process, in order.
+        """
+        inputs: list[tuple[str, str]] = []
+        for msg in messages:
+            text = msg.get("text", "")
+            source = msg.get("source", MessageSource.SYSTEM.value)
+
+            if source in (MessageSource.VOICE.value, MessageSource.SYSTEM.value):
+                continue
+            if not text.strip():
+                continue
+
+            if inputs and inputs[-1][1] == source:
+                inputs[-1] = (inputs[-1][0] + "\n" + text, source)
+            else:
+                inputs.append((text, source))
+        return inputs
+
     def process_pending_messages(
         self,
         process_user_input_function: Callable[[str, str], None],
@@ -249,6 +567,9 @@ class MessageManager:
     ) -> int:
         """Process new messages and invoke a callback for user messages.
 
+        Fetches the whole history on every call; the runner uses the
+        listener thread (start_message_listener/take_pending_inputs) instead.
+
         Args:
             process_user_input_function: Callable that accepts (text, source)
               to process a user message.
@@ -257,33 +578,26 @@ class MessageManager:
         Returns:
             The updated processed message count (int).
         """
-        try:
-            messages = self.get_messages()
-        except Exception:
+        generation = self.messages_generation
+        messages = self.get_messages()
+        if generation is not None and self.messages_generation != generation:
+            # The store was cleared since the last call; every message is new
+            processed_count = 0
+        if len(messages) <= processed_count:
             return processed_count
 
-        if len(messages) > processed_count:
-            for i in range(processed_count, len(messages)):
-                msg = messages[i]
-                text = msg.get("text", "")
-                source = msg.get("source", MessageSource.SYSTEM.value)
-
-                if source in (MessageSource.VOICE.value, MessageSource.SYSTEM.value):
-                    continue
-
-                try:
-                    process_user_input_function(text, source)
-                except Exception as e:
-                    print(f"Failed to process message: {e}")
-
-            processed_count = len(messages)
+        for text, source in self._collect_user_inputs(messages[processed_count:]):
+            try:
+                process_user_input_function(text, source)
+            except Exception as e:
+                print(f"Failed to process message: {e}")
 
-        return processed_count
+        return len(messages)
 
     def set_voice_input_state(self, active: bool) -> bool:
         """Set the voice input state on the ChatWindow server and update local cache."""
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/voice_input_state",
                 json={"active": bool(active)},
                 timeout=5
@@ -304,7 +618,7 @@ class MessageManager:
             The current voice output stop flag (True if stop requested).
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/voice_output_stop_flag",
                 timeout=5
             )
@@ -326,7 +640,7 @@ class MessageManager:
             True if successful, False otherwise.
         """
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/voice_output_stop_flag",
                 json={"stop": bool(stop)},
                 timeout=5
@@ -7,7 +7,7 @@ sys.path.append(str(Path(__file__).resolve().parents[1]))
 sys.path.append(str(Path(__file__).resolve().parents[2]))
 
 from enum import Enum
-from typing import Set
+from functools import lru_cache
 
 
 class MessageSource(Enum):
@@ -19,8 +19,20 @@ class MessageSource(Enum):
         return self.value
 
 
-# Set of allowed source string values
-ALLOWED_SOURCES: Set[str] = {s.value for s in MessageSource}
+# Immutable set of allowed source string values
+ALLOWED_SOURCES: frozenset[str] = frozenset(s.value for s in MessageSource)
+
+
+# Canonical string for every accepted input that needs no case folding
+_CANONICAL_SOURCES: dict = {s.value: s.value for s in MessageSource}
+_CANONICAL_SOURCES.update({s: s.value for s in MessageSource})
+_CANONICAL_SOURCES[None] = MessageSource.SYSTEM.value
+
+
+@lru_cache(maxsize=64)
+def _fold_source(value: str) -> str:
+    """Case-fold a source string and map it to its canonical value."""
+    return _CANONICAL_SOURCES.get(value.lower(), MessageSource.SYSTEM.value)
 
 
 def normalize_source(value) -> str:
@@ -29,9 +41,10 @@ def normalize_source(value) -> str:
     If the provided value is not one of the allowed sources, defaults to
     `MessageSource.SYSTEM.value`.
     """
-    if isinstance(value, MessageSource):
-        return value.value
-    if value is None:
-        return MessageSource.SYSTEM.value
-    v = str(value).lower()
-    return v if v in ALLOWED_SOURCES else MessageSource.SYSTEM.value
+    # Common inputs (canonical strings, enum members, None) are a single
+    # table lookup; other spellings are case-folded once and memoized
+    try:
+        return _CANONICAL_SOURCES[value]
+    except (KeyError, TypeError):
+        pass
+    return _fold_source(str(value))
@@ -12,7 +12,9 @@ from pathlib import Path
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+import re
 import time
+from collections import deque
 from datetime import datetime
 from typing import Optional
 
@@ -21,12 +23,24 @@ from source.voice.voice_manager import VoiceManager
 from source.messenger.message_manager import MessageManager
 from source.messenger.message_source import MessageSource
 
+from configuration.communcation_settings import (
+    MESSENGER_STREAM_FLUSH_CHUNKS,
+    MESSENGER_STREAM_FLUSH_INTERVAL,
+)
 from configuration.person_settings import (
     PERSONALITY_MODEL_NAME,
     WHISPER_TRANSCRIBE_PREFIX,
     PERSONALITY_CORE_SIGNATURE,
+    RUNNER_MAX_HISTORY_ENTRIES,
 )
 
+# Matches "[HH:MM:SS] <WHISPER_TRANSCRIBE_PREFIX> text"
+WHISPER_INPUT_PATTERN = re.compile(
+    r'\[(\d{2}:\d{2}:\d{2})\]\s*' + re.escape(WHISPER_TRANSCRIBE_PREFIX) + r'\s*(.*)')
+
+# str.translate table deleting CR and LF in one pass
+NEWLINE_DELETE_TABLE = str.maketrans("", "", "\r\n")
+
 
 class PersonalityModelRunner:
     """Manages PersonalityCoreManager AI model and voice synthesis integration.
@@ -57,11 +71,11 @@ class PersonalityModelRunner:
         self.voice_manager = VoiceManager()
         self.message_manager = MessageManager()
 
-        self.input_text_history: list[str] = []
-        self.input_time_history: list[str] = []
-        self.output_text_history: list[str] = []
-        self.output_time_history: list[str] = []
-        self.processed_message_count: int = 0
+        # Bounded so long sessions do not grow memory without limit
+        self.input_text_history: deque[str] = deque(maxlen=RUNNER_MAX_HISTORY_ENTRIES)
+        self.input_time_history: deque[str] = deque(maxlen=RUNNER_MAX_HISTORY_ENTRIES)
+        self.output_text_history: deque[str] = deque(maxlen=RUNNER_MAX_HISTORY_ENTRIES)
+        self.output_time_history: deque[str] = deque(maxlen=RUNNER_MAX_HISTORY_ENTRIES)
 
         # Voice input state tracking
         self._prev_voice_input_active: bool = False
@@ -75,12 +89,9 @@ class PersonalityModelRunner:
         Args:
             input_text: Text input to store (format: "[HH:MM:SS] Whisper Transcribe Output: text").
         """
-        import re
-
         # Extract timestamp and text using regex
         # Pattern: [HH:MM:SS] Whisper Transcribe Output: actual_text
-        match = re.match(r'\[(\d{2}:\d{2}:\d{2})\]\s*' +
-                         re.escape(WHISPER_TRANSCRIBE_PREFIX) + r'\s*(.*)', input_text)
+        match = WHISPER_INPUT_PATTERN.match(input_text)
 
         if match:
             timestamp = match.group(1)
@@ -111,8 +122,9 @@ class PersonalityModelRunner:
             output_texts: List of text outputs to store.
         """
         # Remove newlines and add '。' if not already ending with it
-        processed_texts = [text.replace('\n', '').replace('\r', '') if text.endswith(
-            '。') else text.replace('\n', '').replace('\r', '') + '。' for text in output_texts]
+        processed_texts = [
+            text.translate(NEWLINE_DELETE_TABLE) + ('' if text.endswith('。') else '。')
+            for text in output_texts]
         combined_text = ''.join(processed_texts)
         self.output_text_history.append(combined_text)
 
@@ -157,38 +169,55 @@ class PersonalityModelRunner:
         # Store user input
         self.store_input_with_timestamp(text)
 
-        # Display user's voice input in chat first (before assistant response)
-        if source == MessageSource.VOICE.value:
-            self.message_manager.send_message(
-                sender="User (Voice)",
-                text=text,
-                source=MessageSource.VOICE.value
-            )
-
-        # Clear voice queues for new response
+        # Clear voice queues for new response, including sentences of the
+        # previous reply still waiting to be handed to the VoiceManager
+        self.core_manager.clear_pending_sentences()
         try:
             self.voice_manager.request_clear()
         except Exception as e:
             print(f"[Runner] Failed to clear queues: {e}", file=sys.stderr)
 
-        # Send initial empty message to get message ID
-        message_id = self.message_manager.send_message(
-            PERSONALITY_MODEL_NAME, "", source=MessageSource.SYSTEM.value)
-
-        # Generate streaming response
-        response_text = ""
+        # Send initial empty message to get message ID. User's voice input is
+        # displayed first (before assistant response), in the same request
+        items = [(PERSONALITY_MODEL_NAME, "", MessageSource.SYSTEM.value)]
+        if source == MessageSource.VOICE.value:
+            items.insert(0, ("User (Voice)", text, MessageSource.VOICE.value))
+        message_ids = self.message_manager.send_messages(items)
+        message_id = message_ids[-1] if message_ids else None
+
+        # Generate streaming response. New chunks are sent to the chat window
+        # as appended deltas, batched by count or time, in the background so
+        # generation does not wait on the chat server
+        reply_chunks: list[str] = []
+        pending_chunks: list[str] = []
+        last_flush = time.monotonic()
         try:
             for chunk in self.core_manager.generate_response_stream(text):
-                response_text += chunk
+                if message_id is None:
+                    continue
+                reply_chunks.append(chunk)
+                pending_chunks.append(chunk)
+
+                now = time.monotonic()
+                if (len(pending_chunks) >= MESSENGER_STREAM_FLUSH_CHUNKS
+                        or now - last_flush >= MESSENGER_STREAM_FLUSH_INTERVAL):
+                    self.message_manager.append_message_async(
+                        message_id, "".join(pending_chunks))
+                    pending_chunks.clear()
+                    last_flush = now
 
-                # Update message with accumulated text
-                if message_id is not None:
-                    self.message_manager.update_message(
-                        message_id, response_text)
+            if message_id is not None:
+                # Appends are fire-and-forget, so a failed one would leave the
+                # chat window missing or duplicating text; finish with the
+                # complete reply (sent after the queued appends)
+                self.message_manager.update_message_async(
+                    message_id, "".join(reply_chunks))
         except Exception as e:
             error_msg = f"Error: {e}"
             if message_id is not None:
-                self.message_manager.update_message(message_id, error_msg)
+                # Queued behind any pending text update so it is not overwritten
+                self.message_manager.update_message_async(
+                    message_id, error_msg)
             else:
                 self.message_manager.send_message(
                     sender="System", text=error_msg, source=MessageSource.SYSTEM.value)
@@ -220,6 +249,10 @@ class PersonalityModelRunner:
             print("Failed to start MessageManager", file=sys.stderr)
             return 3
 
+        # Receive new messages on a listener thread; the loop is woken as soon
+        # as one arrives and only consumes the queued, unprocessed ones
+        self.message_manager.start_message_listener()
+
         # Print URL for browser access
         chat_url = f"http://{self.message_manager.host}:{self.message_manager.port}"
         print(f"[Runner] Chat window started at: {chat_url}")
@@ -233,14 +266,18 @@ class PersonalityModelRunner:
 
                 # Handle voice output stop flag
                 current_stop_flag = self.message_manager.update_voice_output_stop_flag()
+                if current_stop_flag:
+                    self.core_manager.clear_pending_sentences()
                 self.voice_manager.handle_voice_output_stop_flag(
                     current_stop_flag)
 
-                self.processed_message_count = self.message_manager.process_pending_messages(
-                    self._process_user_input, self.processed_message_count)
+                for text, source in self.message_manager.take_pending_inputs():
+                    self._process_user_input(text, source)
 
-                # Sleep briefly to avoid busy waiting
-                time.sleep(0.2)
+                # Wait for new messages; the timeout keeps the voice state
+                # and stop flag polled at the previous rate
+                if self.message_manager.new_messages_event.wait(timeout=0.2):
+                    self.message_manager.new_messages_event.clear()
 
         except KeyboardInterrupt:
             print("\n[Runner] Interrupted.")
@@ -305,9 +342,5 @@ class PersonalityModelRunner:
         # Store user input
         self.store_input_with_timestamp(user_input)
 
-        # Generate response
-        response = ""
-        for chunk in self.core_manager.generate_response_stream(user_input):
-            response += chunk
-
-        return response
+        # Generate response (chunks are joined once, not concatenated per chunk)
+        return self.core_manager.generate_response(user_input)
@@ -78,6 +78,33 @@ class VoiceManager:
         # Voice output stop flag tracking
         self._prev_voice_output_stop_flag: bool = False
 
+        # One keep-alive session per calling thread (requests.Session is not
+        # thread-safe), so repeated calls reuse the TCP connection
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+        # Shared keep-alive client for the external YUKKURI server
+        self._yukkuri_client: Optional[httpx.Client] = None
+
+    @property
+    def _session(self) -> requests.Session:
+        """Return the HTTP session owned by the calling thread."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    @property
+    def _yukkuri(self) -> httpx.Client:
+        """Return the keep-alive client for YUKKURI (httpx clients are thread-safe)."""
+        with self._sessions_lock:
+            if self._yukkuri_client is None:
+                self._yukkuri_client = httpx.Client()
+            return self._yukkuri_client
+
     def start(self, wait_time: float = 5.0, start_audio_player: bool = True, start_speech_recognizer: bool = True) -> bool:
         """Start VoiceGenerator and optionally AudioPlayer subprocesses.
 
@@ -169,7 +196,7 @@ class VoiceManager:
             max_retries = 5
             for attempt in range(max_retries):
                 try:
-                    response = requests.get(
+                    response = self._session.get(
                         f"{self.voice_gen_url}/queue_status", timeout=2)
                     if response.status_code == RESPONSE_STATUS_CODE_SUCCESS:
                         self.process = self.voice_gen_process  # Backward compatibility
@@ -245,7 +272,7 @@ class VoiceManager:
             max_retries = 5
             for attempt in range(max_retries):
                 try:
-                    response = requests.get(
+                    response = self._session.get(
                         f"{self.audio_player_url}/health", timeout=2)
                     if response.status_code == RESPONSE_STATUS_CODE_SUCCESS:
                         print(f"[VoiceManager] AudioPlayer is responding")
@@ -324,7 +351,7 @@ class VoiceManager:
 
                 # Check if HTTP endpoint is responding
                 try:
-                    response = requests.get(
+                    response = self._session.get(
                         f"{self.speech_recognizer_url}/health", timeout=2)
                     if response.status_code == RESPONSE_STATUS_CODE_SUCCESS:
                         print(
@@ -374,7 +401,7 @@ class VoiceManager:
         if self.speech_recognizer_url is None:
             return False
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.speech_recognizer_url}/voice_input_active",
                 json={"active": active},
                 timeout=3
@@ -393,7 +420,7 @@ class VoiceManager:
         if self.speech_recognizer_url is None:
             return None
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.speech_recognizer_url}/get_sentence",
                 timeout=3
             )
@@ -413,7 +440,7 @@ class VoiceManager:
         if self.speech_recognizer_url is None:
             return None
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.speech_recognizer_url}/get_all_sentences",
                 timeout=3
             )
@@ -437,7 +464,7 @@ class VoiceManager:
         # If recognizer exposes an HTTP API, prefer that
         if self.speech_recognizer_url is not None:
             try:
-                resp = requests.get(
+                resp = self._session.get(
                     f"{self.speech_recognizer_url}/latest", timeout=3)
                 if resp.status_code == RESPONSE_STATUS_CODE_SUCCESS:
                     try:
@@ -505,6 +532,16 @@ class VoiceManager:
             finally:
                 self.speech_recognizer_process = None
 
+        # Close HTTP connections
+        with self._sessions_lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+            if self._yukkuri_client is not None:
+                self._yukkuri_client.close()
+                self._yukkuri_client = None
+        self._local = threading.local()
+
     def _worker_loop(self) -> None:
         """Worker thread loop for async voice generation and playback."""
         while not self.stop_event.is_set():
@@ -578,7 +615,7 @@ class VoiceManager:
             True if request was successful, False otherwise.
         """
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.voice_gen_url}/generate",
                 json={"text": text},
                 timeout=10
@@ -595,7 +632,7 @@ class VoiceManager:
 
     def stop_audio_playback(self) -> bool:
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.audio_player_url}/stop", timeout=2)
             return response.status_code == RESPONSE_STATUS_CODE_SUCCESS
         except:
@@ -620,7 +657,7 @@ class VoiceManager:
                 print(f"[VoiceManager] Failed to clear queue: {e}")
 
             if USE_YUKKURI:
-                httpx.post(YUKKURI_SPEAK_STOP_URL, timeout=5.0)
+                self._yukkuri.post(YUKKURI_SPEAK_STOP_URL, timeout=5.0)
             else:
                 try:
                     self.stop_audio_playback()
@@ -664,7 +701,7 @@ class VoiceManager:
             text: Single text string or list of text strings to generate voice for.
         """
         if USE_YUKKURI:
-            httpx.post(YUKKURI_SPEAK_URL, json={
+            self._yukkuri.post(YUKKURI_SPEAK_URL, json={
                 "text": text}, timeout=10.0)
         else:
             self.text_queue.put(text)
@@ -678,7 +715,7 @@ class VoiceManager:
             WAV binary data if available, None otherwise.
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.voice_gen_url}/get_audio", timeout=10)
 
             if response.status_code == RESPONSE_STATUS_CODE_SUCCESS:
@@ -702,7 +739,7 @@ class VoiceManager:
             True if playback was successful, False otherwise.
         """
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.audio_player_url}/play",
                 data=audio_bytes,
                 headers={'Content-Type': 'application/octet-stream'},
@@ -761,7 +798,7 @@ class VoiceManager:
             Dictionary with 'count' and 'is_empty' keys, or empty dict on error.
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.voice_gen_url}/queue_status", timeout=5)
 
             if response.status_code == RESPONSE_STATUS_CODE_SUCCESS:
@@ -781,7 +818,7 @@ class VoiceManager:
         self.text_queue.queue.clear()
 
         try:
-            response = requests.post(f"{self.voice_gen_url}/clear", timeout=5)
+            response = self._session.post(f"{self.voice_gen_url}/clear", timeout=5)
 
             if response.status_code == RESPONSE_STATUS_CODE_SUCCESS:
                 return True
@@ -808,7 +845,7 @@ class VoiceManager:
             Dictionary with 'is_playing' key, or empty dict on error.
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.audio_player_url}/status", timeout=5)
 
             if response.status_code == RESPONSE_STATUS_CODE_SUCCESS:
@@ -0,0 +1,245 @@
+"""Tests for the chat window message store and HTTP endpoints.
+
+The store is module-level state in `chat_window_gui`, so every test starts
+from a cleared store. No server is started; requests go through Flask's
+test client.
+
+Run with:
+    pytest tests/test_chat_window_gui.py -q
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import json
+import threading
+import time
+
+import pytest
+
+from source.messenger import chat_window_gui as gui
+
+from configuration.communcation_settings import (
+    MESSAGES_GENERATION_HEADER,
+    MESSENGER_MAX_STREAMS,
+    RESPONSE_STATUS_CODE_BAD_REQUEST,
+    RESPONSE_STATUS_CODE_NOT_MODIFIED,
+    RESPONSE_STATUS_CODE_SERVICE_UNAVAILABLE,
+    RESPONSE_STATUS_CODE_SUCCESS,
+)
+
+
+@pytest.fixture(autouse=True)
+def cleared_store():
+    """Start every test from an empty store."""
+    gui.clear_messages()
+    yield
+    gui.clear_messages()
+
+
+@pytest.fixture
+def client():
+    return gui.flask_app.test_client()
+
+
+def test_store_columns_stay_aligned():
+    """Adds, updates and appends read back as consistent message rows."""
+    gui.add_message_to_store("Alice", "a", "chat")
+    gui.add_messages_to_store([{"sender": "Reimu", "text": "b"},
+                               {"sender": "Alice", "text": "c", "source": "voice"}])
+    gui.update_message_in_store(2, "B")
+    gui.append_to_message_in_store(2, "!")
+    assert gui.update_message_in_store(4, "x") is None
+
+    assert [(m["id"], m["sender"], m["text"], m["source"])
+            for m in gui.get_messages_from_store()] == [
+        (1, "Alice", "a", "chat"),
+        (2, "Reimu", "B!", "system"),
+        (3, "Alice", "c", "voice"),
+    ]
+    assert [m["id"] for m in gui.get_messages_since(1)] == [2, 3]
+
+
+def test_messages_since_poll_returns_304_until_the_store_changes(client):
+    """A since-poll with the previous ETag gets 304 until a write happens."""
+    gui.add_message_to_store("Alice", "a", "chat")
+
+    response = client.get("/messages?since=1")
+    assert response.status_code == RESPONSE_STATUS_CODE_SUCCESS
+    assert response.get_json() == []
+    etag = response.headers["ETag"]
+    generation = response.headers[MESSAGES_GENERATION_HEADER]
+
+    response = client.get("/messages?since=1", headers={"If-None-Match": etag})
+    assert response.status_code == RESPONSE_STATUS_CODE_NOT_MODIFIED
+    assert response.headers[MESSAGES_GENERATION_HEADER] == generation
+
+    gui.add_message_to_store("Alice", "b", "chat")
+    response = client.get("/messages?since=1", headers={"If-None-Match": etag})
+    assert response.status_code == RESPONSE_STATUS_CODE_SUCCESS
+    assert [m["text"] for m in response.get_json()] == ["b"]
+    assert response.headers["ETag"] != etag
+
+
+def test_wait_for_messages_since_returns_at_once_for_a_stale_generation():
+    """A poll from before a clear gets the whole new store immediately."""
+    for text in ("a", "b", "c"):
+        gui.add_message_to_store("Alice", text, "chat")
+    _, generation = gui.wait_for_messages_since(3, timeout=0)
+
+    # The clear lands between two polls, not during a wait
+    gui.clear_messages()
+    gui.add_message_to_store("Bob", "x", "chat")
+
+    start = time.monotonic()
+    messages, new_generation = gui.wait_for_messages_since(
+        3, timeout=5, generation=generation)
+    assert time.monotonic() - start < 1
+    assert new_generation == generation + 1
+    assert [(m["id"], m["text"]) for m in messages] == [(1, "x")]
+
+
+def test_ids_restart_and_generation_advances_after_a_clear():
+    gui.add_message_to_store("Alice", "a", "chat")
+    gui.add_message_to_store("Alice", "b", "chat")
+    generation = gui.messages_generation
+
+    gui.clear_messages()
+    gui.add_message_to_store("Bob", "x", "chat")
+
+    assert gui.messages_generation == generation + 1
+    assert [(m["id"], m["text"]) for m in gui.get_messages_since(0)] == [(1, "x")]
+
+
+def test_wait_for_messages_since_wakes_on_a_clear_during_the_wait():
+    """A clear ends a pending wait even when the new store is still empty."""
+    gui.add_message_to_store("Alice", "a", "chat")
+    generation = gui.messages_generation
+    timer = threading.Timer(0.2, gui.clear_messages)
+    timer.start()
+    try:
+        start = time.monotonic()
+        messages, new_generation = gui.wait_for_messages_since(
+            1, timeout=5, generation=generation)
+        assert time.monotonic() - start < 2
+    finally:
+        timer.cancel()
+    assert messages == []
+    assert new_generation == generation + 1
+
+
+def _read_event(events) -> tuple[bytes, dict | list]:
+    """Return the (event name, decoded data) of the next SSE chunk."""
+    chunk = next(events)
+    fields = dict(line.split(b": ", 1) for line in chunk.strip().split(b"\n"))
+    return fields[b"event"], json.loads(fields[b"data"])
+
+
+def test_stream_sends_snapshot_then_deltas(client):
+    """The stream starts with a tagged snapshot and then sends only changes."""
+    gui.add_message_to_store("Alice", "a", "chat")
+    response = client.get("/messages/stream", buffered=False)
+    try:
+        events = iter(response.response)
+        event, data = _read_event(events)
+        assert event == b"snapshot"
+        assert data["generation"] == gui.messages_generation
+        assert [m["text"] for m in data["messages"]] == ["a"]
+
+        gui.add_message_to_store("Alice", "b", "chat")
+        event, data = _read_event(events)
+        assert event == b"messages"
+        assert [(m["id"], m["text"]) for m in data] == [(2, "b")]
+
+        gui.clear_messages()
+        event, data = _read_event(events)
+        assert event == b"snapshot"
+        assert data["generation"] == gui.messages_generation
+        assert data["messages"] == []
+    finally:
+        response.close()
+
+
+def test_wait_for_changes_since_returns_changed_messages_once():
+    gui.add_message_to_store("Alice", "a", "chat")
+    gui.add_message_to_store("Alice", "b", "chat")
+    revision = gui.messages_revision
+
+    gui.update_message_in_store(1, "a2")
+    gui.append_to_message_in_store(1, "!")
+    gui.add_message_to_store("Alice", "c", "chat")
+    changed, revision = gui.wait_for_changes_since(revision, timeout=0)
+    assert [(m["id"], m["text"]) for m in changed] == [(1, "a2!"), (3, "c")]
+
+    assert gui.wait_for_changes_since(revision, timeout=0) == ([], revision)
+
+
+def test_wait_for_changes_since_asks_for_a_reload():
+    """After a clear, or once the change log is outrun, the result is None."""
+    revision = gui.messages_revision
+    gui.clear_messages()
+    assert gui.wait_for_changes_since(revision, timeout=0)[0] is None
+
+    revision = gui.messages_revision
+    for i in range(gui.MESSAGE_CHANGE_LOG_SIZE + 1):
+        gui.add_message_to_store("Alice", str(i), "chat")
+    assert gui.wait_for_changes_since(revision, timeout=0)[0] is None
+
+
+def test_stream_cap_refuses_extra_streams(client):
+    """Beyond MESSENGER_MAX_STREAMS, streams get 503 until a slot is freed."""
+    responses = [client.get("/messages/stream", buffered=False)
+                 for _ in range(MESSENGER_MAX_STREAMS)]
+    try:
+        assert all(r.status_code == RESPONSE_STATUS_CODE_SUCCESS for r in responses)
+
+        refused = client.get("/messages/stream", buffered=False)
+        assert refused.status_code == RESPONSE_STATUS_CODE_SERVICE_UNAVAILABLE
+        assert refused.get_data().startswith(b"retry: ")
+        assert "Retry-After" in refused.headers
+
+        responses.pop().close()
+        responses.append(client.get("/messages/stream", buffered=False))
+        assert responses[-1].status_code == RESPONSE_STATUS_CODE_SUCCESS
+    finally:
+        for response in responses:
+            response.close()
+    assert gui.active_streams == 0
+
+
+def test_patch_append_extends_the_message_text(client):
+    """Appends reply with the new length; unknown ids get 404."""
+    gui.add_message_to_store("Reimu", "Hel", "system")
+
+    response = client.patch("/messages/1", json={"append": "lo"})
+    assert response.status_code == RESPONSE_STATUS_CODE_SUCCESS
+    assert response.get_json() == {"id": 1, "length": 5}
+    assert gui.get_messages_from_store()[0]["text"] == "Hello"
+
+    assert client.patch("/messages/2", json={"append": "x"}).status_code == 404
+
+
+def test_bulk_post_adds_messages_in_order(client):
+    response = client.post("/messages/bulk", json={"items": [
+        {"sender": "User (Voice)", "text": "hi", "source": "voice"},
+        {"sender": "Reimu", "text": ""},
+    ]})
+    assert response.status_code == 201
+    assert [(m["id"], m["sender"], m["source"]) for m in response.get_json()] == [
+        (1, "User (Voice)", "voice"), (2, "Reimu", "system")]
+
+
+@pytest.mark.parametrize("body", [
+    {"items": "not a list"},
+    {"items": ["not an object"]},
+    {"items": [{"sender": "Alice", "text": 1}]},
+    ["not an object"],
+])
+def test_bulk_post_rejects_malformed_items(client, body):
+    """Malformed bulk requests get 400 and add nothing."""
+    response = client.post("/messages/bulk", json=body)
+    assert response.status_code == RESPONSE_STATUS_CODE_BAD_REQUEST
+    assert gui.get_messages_from_store() == []
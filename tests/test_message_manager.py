@@ -0,0 +1,175 @@
+"""Tests for MessageManager against an in-process chat window server.
+
+The Flask app from `chat_window_gui` is served on an ephemeral port in a
+background thread, so no subprocess is started.
+
+Run with:
+    pytest tests/test_message_manager.py -q
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import threading
+import time
+
+import pytest
+from werkzeug.serving import make_server
+
+from source.messenger import chat_window_gui as gui
+from source.messenger.message_manager import MessageManager
+
+
+@pytest.fixture(scope="module")
+def server_port():
+    """Serve the chat window app on an ephemeral port for this module."""
+    server = make_server("127.0.0.1", 0, gui.flask_app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_port
+    server.shutdown()
+
+
+@pytest.fixture
+def manager(server_port):
+    """MessageManager talking to the in-process server, with an empty store."""
+    gui.clear_messages()
+    manager = MessageManager(host="127.0.0.1", port=server_port)
+    yield manager
+    manager.stop()
+    gui.clear_messages()
+
+
+def test_get_messages_etag_is_tied_to_since(manager):
+    """A 304 for one since value must not hide messages for another."""
+    for text in ("a", "b", "c", "d", "e"):
+        manager.send_message("Alice", text, "chat")
+
+    assert [m["text"] for m in manager.get_messages(since=4)] == ["e"]
+    # Same since and unchanged store: answered with 304, nothing new
+    assert manager.get_messages(since=4) == []
+    assert [m["text"] for m in manager.get_messages(since=1)] == [
+        "b", "c", "d", "e"]
+
+
+def _wait_for_inputs(manager, count: int, timeout: float = 5.0) -> list:
+    """Collect listener inputs until count arrived or timeout expires."""
+    inputs = []
+    deadline = time.monotonic() + timeout
+    while len(inputs) < count and time.monotonic() < deadline:
+        manager.new_messages_event.wait(0.05)
+        manager.new_messages_event.clear()
+        inputs += manager.take_pending_inputs()
+    return inputs
+
+
+def test_listener_delivers_messages_across_a_clear(manager):
+    """Messages posted after a clear are queued even though ids restart."""
+    for text in ("a", "b", "c"):
+        manager.send_message("Alice", text, "chat")
+    manager.start_message_listener()
+    assert _wait_for_inputs(manager, 1) == [("a\nb\nc", "chat")]
+
+    manager.clear_messages()
+    manager.send_message("Alice", "x", "chat")
+    assert _wait_for_inputs(manager, 1) == [("x", "chat")]
+
+
+def test_listener_survives_an_error(manager, monkeypatch):
+    """An exception in one poll is logged and the listener keeps running."""
+    listen_once = manager._listen_once
+    calls = []
+
+    def failing_once(last_id, generation):
+        calls.append(last_id)
+        if len(calls) == 1:
+            raise ValueError("malformed reply")
+        return listen_once(last_id, generation)
+
+    monkeypatch.setattr(manager, "_listen_once", failing_once)
+    manager.send_message("Alice", "a", "chat")
+    manager.start_message_listener()
+    assert _wait_for_inputs(manager, 1) == [("a", "chat")]
+    assert len(calls) >= 2
+
+
+def test_process_pending_messages(manager):
+    """Only unprocessed user messages reach the callback, also after a clear."""
+    received = []
+    manager.send_message("Alice", "a", "chat")
+    manager.send_message("Reimu", "reply", "system")
+    manager.send_message("Alice", "b", "chat")
+    manager.send_message("Alice", "c", "chat")
+
+    count = manager.process_pending_messages(
+        lambda text, source: received.append(text), 0)
+    assert count == 4
+    assert received == ["a\nb\nc"]
+
+    assert manager.process_pending_messages(
+        lambda text, source: received.append(text), count) == count
+    assert received == ["a\nb\nc"]
+
+    manager.clear_messages()
+    manager.send_message("Alice", "x", "chat")
+    count = manager.process_pending_messages(
+        lambda text, source: received.append(text), count)
+    assert count == 1
+    assert received == ["a\nb\nc", "x"]
+
+
+def test_collect_user_inputs_merges_a_burst():
+    """Consecutive user messages of one source become a single input."""
+    messages = [
+        {"text": "a", "source": "chat"},
+        {"text": "b", "source": "chat"},
+        {"text": "reply", "source": "system"},
+        {"text": "heard", "source": "voice"},
+        {"text": "  ", "source": "chat"},
+        {"text": "c", "source": "chat"},
+    ]
+    assert MessageManager._collect_user_inputs(messages) == [("a\nb\nc", "chat")]
+
+
+def test_collect_user_inputs_without_user_messages():
+    assert MessageManager._collect_user_inputs([]) == []
+    assert MessageManager._collect_user_inputs([{"text": "reply"}]) == []
+
+
+def test_async_requests_keep_submission_order():
+    """Only consecutive requests of one kind are merged; order is kept."""
+    manager = MessageManager(host="127.0.0.1", port=0)
+    sent = []
+    release = threading.Event()
+
+    def update_message(message_id, text):
+        release.wait(5)
+        sent.append(("text", message_id, text))
+        return True
+
+    def append_message(message_id, text):
+        sent.append(("append", message_id, text))
+        return True
+
+    manager.update_message = update_message
+    manager.append_message = append_message
+
+    # Blocks the sender thread so the requests below stay queued
+    manager.update_message_async(99, "blocker")
+    manager.update_message_async(1, "U1")
+    manager.append_message_async(1, "A1")
+    manager.append_message_async(1, "A2")
+    last = manager.update_message_async(1, "U2")
+    release.set()
+    assert last.result(timeout=5)
+
+    assert sent == [
+        ("text", 99, "blocker"),
+        ("text", 1, "U1"),
+        ("append", 1, "A1A2"),
+        ("text", 1, "U2"),
+    ]
+    manager.stop()
@@ -0,0 +1,35 @@
+"""Tests for message source normalization.
+
+Run with:
+    pytest tests/test_message_source.py -q
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+from source.messenger.message_source import MessageSource, normalize_source
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("chat", "chat"),
+    ("VOICE", "voice"),
+    (" Chat", "system"),
+    (MessageSource.CHAT, "chat"),
+    (None, "system"),
+    ("discord", "system"),
+    (3, "system"),
+    (["chat"], "system"),
+])
+def test_normalize_source(value, expected):
+    assert normalize_source(value) == expected
+
+
+def test_normalize_source_returns_the_canonical_string():
+    """Results are the shared enum values, so the store keeps one copy."""
+    assert normalize_source("".join(["ch", "at"])) is MessageSource.CHAT.value
+    assert normalize_source("Voice") is MessageSource.VOICE.value
@@ -0,0 +1,300 @@
+"""Tests for PersonalityCoreManager parts that do not need a real model.
+
+Model loading is exercised with a stand-in `llama_cpp` module, so these
+tests run without llama-cpp-python or a GGUF file.
+
+Run with:
+    pytest tests/test_personality_core_manager.py -q
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import threading
+import types
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from source.core.personality_core_manager import (
+    PersonalityCoreManager,
+    normalize_cache_key,
+    split_sentences,
+)
+
+
+MODEL_CONTENT = bytes(range(256)) * 64
+
+
+def _quiet_manager(**kwargs) -> PersonalityCoreManager:
+    return PersonalityCoreManager(
+        on_progress=lambda downloaded, total: None, **kwargs)
+
+
+@pytest.fixture
+def fake_llama(monkeypatch):
+    """Install a stand-in llama_cpp module; yields its constructor call log."""
+    calls = []
+    errors = []
+
+    class FakeLlama:
+        def __init__(self, **kwargs):
+            calls.append(kwargs)
+            if errors:
+                raise errors.pop(0)
+
+        def close(self):
+            pass
+
+    module = types.SimpleNamespace(
+        Llama=FakeLlama, LlamaRAMCache=None, GGML_TYPE_Q8_0=8)
+    monkeypatch.setitem(sys.modules, "llama_cpp", module)
+    yield calls, errors
+
+
+@pytest.fixture
+def model_file(tmp_path):
+    path = tmp_path / "model.gguf"
+    path.write_bytes(b"GGUF")
+    return path
+
+
+def test_split_sentences():
+    """Complete sentences are stripped; the tail is returned unchanged."""
+    assert split_sentences("こんにちは。元気？ まだ途中") == (
+        ["こんにちは。", "元気？"], " まだ途中")
+
+
+def test_split_sentences_merges_runs_of_endings():
+    """A run like "！？" ends one sentence instead of producing empty ones."""
+    assert split_sentences("本当！？うん!") == (["本当！？", "うん!"], "")
+
+
+def test_split_sentences_without_boundary():
+    assert split_sentences("") == ([], "")
+    assert split_sentences("途中の文") == ([], "途中の文")
+
+
+def test_unknown_kv_cache_type_is_rejected():
+    with pytest.raises(ValueError):
+        _quiet_manager(kv_cache_type="q9_9")
+    assert _quiet_manager(kv_cache_type="Q8_0").kv_cache_type == "Q8_0"
+
+
+def test_start_retries_without_attention_options_on_context_errors(fake_llama, model_file):
+    calls, errors = fake_llama
+    errors.append(ValueError("Failed to create llama_context"))
+    manager = _quiet_manager(model_path=str(model_file), flash_attn=True,
+                             kv_cache_type="q8_0")
+    assert manager.start()
+    manager.stop()
+
+    assert len(calls) == 2
+    assert calls[0]["flash_attn"] is True
+    assert calls[0]["type_k"] == calls[0]["type_v"] == 8
+    assert "flash_attn" not in calls[1] and "type_k" not in calls[1]
+
+
+def test_start_does_not_retry_model_load_errors(fake_llama, model_file):
+    calls, errors = fake_llama
+    errors.append(ValueError(f"Failed to load model from file: {model_file}"))
+    manager = _quiet_manager(model_path=str(model_file), flash_attn=True)
+    assert not manager.start()
+    assert len(calls) == 1
+
+
+def test_start_passes_no_attention_options_for_defaults(fake_llama, model_file):
+    calls, _ = fake_llama
+    manager = _quiet_manager(model_path=str(model_file), flash_attn=False,
+                             offload_kqv=True, kv_cache_type="f16")
+    assert manager.start()
+    manager.stop()
+    assert not {"flash_attn", "offload_kqv", "type_k", "type_v"} & set(calls[0])
+
+
+def test_compact_history_cuts_to_half_and_keeps_the_system_prompt():
+    manager = _quiet_manager(max_history_turns=4)
+    manager.clear_history()
+    for turn in range(4):
+        manager.messages += [{"role": "user", "content": f"u{turn}"},
+                             {"role": "assistant", "content": f"a{turn}"}]
+    manager._compact_history()
+    assert len(manager.messages) == 9
+
+    manager.messages.append({"role": "user", "content": "u4"})
+    manager.messages.append({"role": "assistant", "content": "a4"})
+    manager._compact_history()
+    assert manager.messages[0]["role"] == "system"
+    assert [m["content"] for m in manager.messages[1:]] == [
+        "u3", "a3", "u4", "a4"]
+
+
+def test_compact_history_starts_with_a_user_message():
+    """An unanswered input leaves the kept history starting at a user turn."""
+    manager = _quiet_manager(max_history_turns=3)
+    manager.clear_history()
+    for turn in range(4):
+        manager.messages += [{"role": "user", "content": f"u{turn}"},
+                             {"role": "assistant", "content": f"a{turn}"}]
+    manager.messages.append({"role": "user", "content": "u4"})
+    manager._compact_history()
+    assert [m["content"] for m in manager.messages[1:]] == ["u4"]
+
+
+def _chat_manager(reply: str, **kwargs) -> tuple[PersonalityCoreManager, list]:
+    """Return a running manager whose model streams reply; yields its call log."""
+    manager = _quiet_manager(**kwargs)
+    calls = []
+
+    def create_chat_completion(messages, stream):
+        calls.append([m["content"] for m in messages])
+        return ({"choices": [{"delta": {"content": char}}]} for char in reply)
+
+    manager.llm = types.SimpleNamespace(
+        create_chat_completion=create_chat_completion)
+    manager.is_running = True
+    manager.clear_history()
+    return manager, calls
+
+
+def test_reply_cache_replays_without_running_the_model():
+    manager, calls = _chat_manager("はい。どうぞ", response_cache_size=4)
+    sentences = []
+    manager.on_sentence_complete = sentences.append
+
+    assert manager.generate_response("質問") == "はい。どうぞ"
+    assert manager.generate_response("質問") == "はい。どうぞ"
+    assert len(calls) == 1
+    assert sentences == ["はい。", "どうぞ"] * 2
+    assert [m["role"] for m in manager.messages] == [
+        "system", "user", "assistant", "user", "assistant"]
+
+
+def test_reply_cache_is_bounded_and_skips_stopped_replies():
+    manager, calls = _chat_manager("はい", response_cache_size=1)
+    manager.generate_response("a")
+    manager.generate_response("b")
+    manager.generate_response("a")
+    assert len(calls) == 3
+
+    manager, calls = _chat_manager("はい", response_cache_size=1)
+    stream = manager.generate_response_stream("a")
+    next(stream)
+    manager.is_running = False
+    "".join(stream)
+    manager.is_running = True
+    manager.generate_response("a")
+    assert len(calls) == 2
+
+
+def test_normalize_cache_key_ignores_width_case_and_punctuation():
+    assert normalize_cache_key("こんにちは！") == normalize_cache_key("こんにちは")
+    assert normalize_cache_key("ＨＥＬＬＯ, world?") == normalize_cache_key("hello world")
+    assert normalize_cache_key("元気") != normalize_cache_key("元気？ねえ")
+
+
+def test_reply_cache_matches_normalized_input():
+    manager, calls = _chat_manager("はい", response_cache_size=4)
+    manager.generate_response("おはよう！")
+    manager.generate_response("おはよう")
+    assert len(calls) == 1
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    """Serves MODEL_CONTENT, answering Range requests like a CDN would."""
+
+    support_range = True
+    requested_ranges: list = []
+
+    def do_GET(self):
+        content = MODEL_CONTENT
+        range_header = self.headers.get("Range")
+        self.requested_ranges.append(range_header)
+        if range_header and self.support_range:
+            start = int(range_header.removeprefix("bytes=").rstrip("-"))
+            if start >= len(content):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(content)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = content[start:]
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(content) - 1}/{len(content)}")
+        else:
+            body = content
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def model_server():
+    """Yield (url, handler class) of a local server hosting MODEL_CONTENT."""
+    handler = type("Handler", (_RangeHandler,), {"requested_ranges": []})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/model.gguf", handler
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def download_manager():
+    return _quiet_manager()
+
+
+def _download(manager, url, tmp_path, part_content=None) -> Path:
+    destination = tmp_path / "model.gguf"
+    if part_content is not None:
+        (tmp_path / "model.gguf.part").write_bytes(part_content)
+    manager._download_model(url, destination)
+    return destination
+
+
+def test_download_model_from_scratch(download_manager, model_server, tmp_path):
+    url, handler = model_server
+    destination = _download(download_manager, url, tmp_path)
+    assert destination.read_bytes() == MODEL_CONTENT
+    assert handler.requested_ranges == [None]
+    assert not (tmp_path / "model.gguf.part").exists()
+
+
+def test_download_model_resumes_partial_file(download_manager, model_server, tmp_path):
+    url, handler = model_server
+    destination = _download(download_manager, url, tmp_path, MODEL_CONTENT[:1000])
+    assert destination.read_bytes() == MODEL_CONTENT
+    assert handler.requested_ranges == ["bytes=1000-"]
+
+
+def test_download_model_restarts_when_range_is_ignored(download_manager, model_server, tmp_path):
+    url, handler = model_server
+    handler.support_range = False
+    destination = _download(download_manager, url, tmp_path, b"stale partial data")
+    assert destination.read_bytes() == MODEL_CONTENT
+
+
+def test_download_model_416_with_complete_part(download_manager, model_server, tmp_path):
+    """A 416 for a .part of exactly the remote size publishes it as is."""
+    url, handler = model_server
+    destination = _download(download_manager, url, tmp_path, MODEL_CONTENT)
+    assert destination.read_bytes() == MODEL_CONTENT
+    assert handler.requested_ranges == [f"bytes={len(MODEL_CONTENT)}-"]
+
+
+def test_download_model_416_with_oversized_part(download_manager, model_server, tmp_path):
+    """A .part larger than the remote file is discarded and re-downloaded."""
+    url, handler = model_server
+    destination = _download(download_manager, url, tmp_path, MODEL_CONTENT + b"extra")
+    assert destination.read_bytes() == MODEL_CONTENT
+    assert handler.requested_ranges == [
+        f"bytes={len(MODEL_CONTENT) + 5}-", None]
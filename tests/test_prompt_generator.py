@@ -0,0 +1,57 @@
+"""Tests for PromptGenerator and its mtime-keyed file cache.
+
+Run with:
+    pytest tests/test_prompt_generator.py -q
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import os
+
+import pytest
+
+from source.core.prompt_generator import PromptGenerator
+
+
+@pytest.fixture
+def prompt_files(tmp_path):
+    """Write the three prompt files and return their paths."""
+    paths = []
+    for name, text in (("world", "世界"), ("person", "人物"), ("scene", "場面")):
+        path = tmp_path / f"{name}.md"
+        path.write_text(text, encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def test_generate_pre_prompt_joins_sections(prompt_files):
+    generator = PromptGenerator(*map(str, prompt_files))
+    assert generator.generate_pre_prompt() == (
+        "[世界観設定]\n\n世界\n\n[人物設定]\n\n人物\n\n[シーン設定]\n\n場面")
+
+
+def test_generate_pre_prompt_rereads_only_after_an_edit(prompt_files):
+    """Unchanged files are served from the cache; a new mtime is re-read."""
+    world, person, scene = prompt_files
+    generator = PromptGenerator(str(world), str(person), str(scene))
+    first = generator.generate_pre_prompt()
+
+    # Same mtime: the cached prompt is returned without reading the file
+    mtime_ns = scene.stat().st_mtime_ns
+    scene.write_text("場面\r\nその二", encoding="utf-8")
+    os.utime(scene, ns=(mtime_ns, mtime_ns))
+    assert generator.generate_pre_prompt() is first
+
+    os.utime(scene, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+    assert generator.generate_pre_prompt().endswith("[シーン設定]\n\n場面\nその二")
+
+
+def test_generate_pre_prompt_reports_missing_files(prompt_files, tmp_path):
+    world, person, _ = prompt_files
+    generator = PromptGenerator(str(world), str(person), str(tmp_path / "none.md"))
+    with pytest.raises(FileNotFoundError, match="none.md"):
+        generator.generate_pre_prompt()